@@ -4,17 +4,56 @@ Provides lightweight API surface needed by the client UI, including
 leaderboard information used by power users.
 """
 
+import hashlib
 import logging
-from fastapi import APIRouter, Depends, HTTPException
+import time
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from app.core.config import settings
 from app.core.database import get_async_database_session
 from app.schemas import AdminLeaderboardResponse, AdminLeaderboardEntry
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_LEADERBOARD_TIME_FILTERS = {
+    "all": "",
+    "week": " AND day >= date_trunc('week', now())::date",
+    "month": " AND day >= date_trunc('month', now())::date",
+}
+
+# One precompiled leaderboard query per supported range, summing the
+# trigger-maintained daily rollup rather than scanning "Transcriptions"
+_LEADERBOARD_SQL = {
+    rng: text(
+        f"""
+        SELECT admin, SUM(count) AS count
+        FROM "AdminDailyCounts"
+        WHERE count > 0 {time_filter}
+        GROUP BY admin
+        ORDER BY count DESC, admin ASC;
+        """
+    )
+    for rng, time_filter in _LEADERBOARD_TIME_FILTERS.items()
+}
+
+# range -> (expires_at monotonic time, serialized AdminLeaderboardResponse, ETag)
+_leaderboard_cache = {}
+
+
+def _leaderboard_response(request: Request, payload: str, etag: str) -> Response:
+    """Return the leaderboard JSON, or 304 when the client already has it."""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={max(settings.LEADERBOARD_CACHE_TTL_SECONDS, 0)}",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
 
 @router.get(
     "/leaderboard",
@@ -22,6 +61,7 @@ router = APIRouter()
     summary="Fetch aggregated admin transcription counts",
 )
 async def get_admin_leaderboard(
+    request: Request,
     range: str = "all",
     db: AsyncSession = Depends(get_async_database_session),
 ) -> AdminLeaderboardResponse:
@@ -29,26 +69,14 @@ async def get_admin_leaderboard(
 
     try:
         rng = (range or "all").lower()
-        if rng not in {"all", "week", "month"}:
+        if rng not in _LEADERBOARD_SQL:
             rng = "all"
 
-        time_filter = ""
-        if rng == "week":
-            time_filter = " AND created_at >= date_trunc('week', now())"
-        elif rng == "month":
-            time_filter = " AND created_at >= date_trunc('month', now())"
-
-        query = text(
-            f"""
-            SELECT admin, COUNT(*) AS count
-            FROM "Transcriptions"
-            WHERE admin IS NOT NULL {time_filter}
-            GROUP BY admin
-            ORDER BY count DESC, admin ASC;
-            """
-        )
-
-        result = await db.execute(query)
+        cached = _leaderboard_cache.get(rng)
+        if cached is not None and cached[0] > time.monotonic():
+            return _leaderboard_response(request, cached[1], cached[2])
+
+        result = await db.execute(_LEADERBOARD_SQL[rng])
         rows = result.fetchall()
 
         leaders = [
@@ -58,7 +86,18 @@ async def get_admin_leaderboard(
         ]
         total = sum(entry.count for entry in leaders)
 
-        return AdminLeaderboardResponse(success=True, range=rng, total=total, leaders=leaders)
+        payload = AdminLeaderboardResponse(
+            success=True, range=rng, total=total, leaders=leaders
+        ).model_dump_json()
+        etag = f'"{hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()}"'
+        if settings.LEADERBOARD_CACHE_TTL_SECONDS > 0:
+            _leaderboard_cache[rng] = (
+                time.monotonic() + settings.LEADERBOARD_CACHE_TTL_SECONDS,
+                payload,
+                etag,
+            )
+
+        return _leaderboard_response(request, payload, etag)
     except Exception as exc:
         logger.error("Error generating admin leaderboard: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to load leaderboard data")
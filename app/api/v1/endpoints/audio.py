@@ -10,7 +10,8 @@ This module provides REST API endpoints for:
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_database_session
@@ -58,8 +59,13 @@ async def get_random_audio_clip(
             )
         
         # Generate signed URL for direct access to the audio file in GCS
+        url_was_cached = gcs_service.has_cached_signed_url(audio_file.audio_filename)
         signed_url = await gcs_service.generate_signed_url(audio_file.audio_filename)
         
+        # A miss means the prewarmed window is used up; sign the next clips ahead of time
+        if not url_was_cached:
+            AudioService.schedule_signed_url_prewarm()
+        
         logger.info(
             f"Serving audio file: {audio_file.audio_filename} "
             f"(transcriptions: {audio_file.transcription_count})"
@@ -159,7 +165,10 @@ async def upload_transcriptions_csv(
     summary="Get all files metadata",
     description="Returns metadata for all files in the Google Cloud Storage bucket"
 )
-async def get_all_files_metadata():
+async def get_all_files_metadata(
+    page_token: Optional[str] = None,
+    page_size: Optional[int] = Query(None, ge=1, le=1000),
+):
     """
     Get metadata for all files in the GCS bucket.
     
@@ -169,14 +178,26 @@ async def get_all_files_metadata():
     - Content types
     - Creation and modification dates
     - Whether the file is an audio file
+    
+    Pass page_size (and then the returned next_page_token) to list the bucket
+    one page at a time instead of all at once. Counts then cover the page only.
     """
     try:
-        # Get all files metadata from GCS
-        files_metadata = await gcs_service.list_all_files()
+        next_page_token = None
+        if page_size is not None or page_token is not None:
+            page = await gcs_service.list_files_page(
+                page_token=page_token,
+                max_results=page_size or 1000,
+            )
+            files_metadata = page['items']
+            next_page_token = page['next_page_token']
+        else:
+            # Get all files metadata from GCS
+            files_metadata = await gcs_service.list_all_files()
         
         # Calculate statistics
         total_files = len(files_metadata)
-        audio_files = sum(1 for f in files_metadata if f['is_audio_file'])
+        audio_files = sum(1 for f in files_metadata if f.is_audio_file)
         other_files = total_files - audio_files
         
         logger.info(
@@ -188,7 +209,8 @@ async def get_all_files_metadata():
             total_files=total_files,
             audio_files=audio_files,
             other_files=other_files,
-            files=files_metadata
+            files=files_metadata,
+            next_page_token=next_page_token
         )
         
     except Exception as e:
@@ -224,31 +246,14 @@ async def compare_audio_files(
         logger.info("Fetching audio files from GCS bucket...")
         gcs_audio_files = await gcs_service.list_all_audio_files()
         
-        # Get all audio records from database
+        # Stream audio records from database, collecting DB-only files as we go
         logger.info("Fetching audio records from database...")
-        db_audio_files = await AudioService.get_all_audio_files(db)
-        
-        # Create sets of filenames for comparison
-        gcs_filenames = {file['filename'] for file in gcs_audio_files}
-        db_filenames = {audio.audio_filename for audio in db_audio_files}
-        
-        # Find files that exist only in GCS (not in DB)
-        cloud_only_filenames = gcs_filenames - db_filenames
-        cloud_only_files = []
-        for gcs_file in gcs_audio_files:
-            if gcs_file['filename'] in cloud_only_filenames:
-                cloud_only_files.append(AudioFileComparisonItem(
-                    filename=gcs_file['filename'],
-                    full_path=gcs_file['full_path'],
-                    size_bytes=gcs_file['size_bytes'],
-                    size_mb=gcs_file['size_mb']
-                ))
-        
-        # Find files that exist only in DB (not in GCS)
-        db_only_filenames = db_filenames - gcs_filenames
+        gcs_filenames = {file.filename for file in gcs_audio_files}
+        db_filenames = set()
         db_only_files = []
-        for db_audio in db_audio_files:
-            if db_audio.audio_filename in db_only_filenames:
+        async for db_audio in AudioService.get_all_audio_files(db):
+            db_filenames.add(db_audio.audio_filename)
+            if db_audio.audio_filename not in gcs_filenames:
                 db_only_files.append(AudioFileComparisonItem(
                     filename=db_audio.audio_filename,
                     audio_id=db_audio.audio_id,
@@ -256,22 +261,33 @@ async def compare_audio_files(
                     google_transcription=db_audio.google_transcription
                 ))
         
+        # Find files that exist only in GCS (not in DB)
+        cloud_only_files = []
+        for gcs_file in gcs_audio_files:
+            if gcs_file.filename not in db_filenames:
+                cloud_only_files.append(AudioFileComparisonItem(
+                    filename=gcs_file.filename,
+                    full_path=gcs_file.full_path,
+                    size_bytes=gcs_file.size_bytes,
+                    size_mb=gcs_file.size_mb
+                ))
+        
         # Calculate matched files
         matched_files_count = len(gcs_filenames & db_filenames)
         
         # Create summary statistics
         summary = {
             "total_gcs_audio_files": len(gcs_audio_files),
-            "total_db_audio_records": len(db_audio_files),
+            "total_db_audio_records": len(db_filenames),
             "cloud_only_count": len(cloud_only_files),
             "db_only_count": len(db_only_files),
             "matched_count": matched_files_count,
-            "gcs_total_size_mb": round(sum(f['size_mb'] for f in gcs_audio_files), 2)
+            "gcs_total_size_mb": round(sum(f.size_mb for f in gcs_audio_files), 2)
         }
         
         logger.info(
             f"Audio comparison completed: "
-            f"GCS={len(gcs_audio_files)}, DB={len(db_audio_files)}, "
+            f"GCS={len(gcs_audio_files)}, DB={len(db_filenames)}, "
             f"Cloud-only={len(cloud_only_files)}, DB-only={len(db_only_files)}, "
             f"Matched={matched_files_count}"
         )
@@ -5,13 +5,16 @@ This module provides REST API endpoints for:
 - Submitting user transcriptions with quality metadata
 - Validating audio file existence before transcription submission
 - Managing transcription counts and lease releases automatically
+- Submitting transcriptions in bulk for backfills and batch labeling
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List
+from fastapi import APIRouter, Body, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists
 
+from app.core.config import settings
 from app.core.database import get_async_database_session
 from app.models import Audio
 from app.schemas import (
@@ -46,30 +49,32 @@ async def create_transcription(
     The lease-based system prevents race conditions and ensures proper concurrency handling.
     """
     try:
-        # Verify the audio file exists
-        result = await db.execute(select(Audio).where(Audio.audio_id == transcription_data.audio_id))
-        audio_file = result.scalar_one_or_none()
+        # Verify the audio file exists without loading the row
+        audio_exists = await db.scalar(
+            select(exists().where(Audio.audio_id == transcription_data.audio_id))
+        )
         
-        if not audio_file:
+        if not audio_exists:
             raise HTTPException(
                 status_code=404,
                 detail=f"Audio file not found: {transcription_data.audio_id}"
             )
         
-        # Create the transcription (this will also handle the lease release and count increment)
-        new_transcription = await TranscriptionService.create_transcription(
+        # Create the transcription and release the lease in a single statement
+        # (transcription_count is incremented by the database trigger)
+        new_transcription = await TranscriptionService.create_transcription_and_release(
             db,
             transcription_data,
         )
         
         logger.info(
             f"Created transcription {new_transcription.trans_id} "
-            f"for audio {audio_file.audio_filename}"
+            f"for audio {transcription_data.audio_id}"
         )
         
         return TranscriptionResponse(
             trans_id=new_transcription.trans_id,
-            audio_id=audio_file.audio_id,
+            audio_id=new_transcription.audio_id,
             transcription=new_transcription.transcription,
             speaker_gender=new_transcription.speaker_gender,
             has_noise=new_transcription.has_noise,
@@ -89,3 +94,66 @@ async def create_transcription(
             status_code=500,
             detail="Internal server error while creating transcription"
         )
+
+
+@router.post(
+    "/bulk",
+    response_model=List[TranscriptionResponse],
+    status_code=201,
+    summary="Submit transcriptions in bulk",
+    description="Submit multiple user transcriptions in a single request"
+)
+async def create_transcriptions_bulk(
+    transcriptions_data: List[TranscriptionCreate] = Body(
+        ..., max_length=settings.MAX_BULK_TRANSCRIPTIONS
+    ),
+    db: AsyncSession = Depends(get_async_database_session)
+):
+    """
+    Create many transcriptions in one request.
+    
+    This endpoint:
+    1. Validates that every referenced audio file exists
+    2. Inserts all transcriptions in a single transaction (all or nothing)
+    3. Returns the created records in submission order
+    
+    At most MAX_BULK_TRANSCRIPTIONS items are accepted per request.
+    """
+    try:
+        if not transcriptions_data:
+            raise HTTPException(
+                status_code=400,
+                detail="Transcriptions list cannot be empty"
+            )
+
+        # Verify every referenced audio file exists with a single query
+        audio_ids = {item.audio_id for item in transcriptions_data}
+        result = await db.execute(select(Audio.audio_id).where(Audio.audio_id.in_(audio_ids)))
+        missing_ids = audio_ids - set(result.scalars().all())
+
+        if missing_ids:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Audio files not found: {', '.join(sorted(str(audio_id) for audio_id in missing_ids))}"
+            )
+
+        new_transcriptions = await TranscriptionService.create_transcriptions_bulk(
+            db,
+            transcriptions_data,
+        )
+
+        logger.info(f"Created {len(new_transcriptions)} transcriptions in bulk")
+
+        return [
+            TranscriptionResponse.model_validate(transcription)
+            for transcription in new_transcriptions
+        ]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating transcriptions in bulk: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error while creating transcriptions"
+        )
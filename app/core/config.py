@@ -31,10 +31,19 @@ class Settings(BaseSettings):
 
     # Database configuration
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg prepared statement cache; set 0 behind PgBouncer transaction pooling
+    DB_POOL_SIZE: int = 0  # Persistent connections per process; 0 disables pooling (NullPool) for serverless
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed above DB_POOL_SIZE under load
+    DB_CONNECT_TIMEOUT_SECONDS: int = 10  # Give up on opening a database connection after this long
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # Server-side cap on a single statement; 0 disables
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS: int = 60000  # Server ends sessions idle inside a transaction this long; 0 disables
 
     # Google Cloud Storage configuration
     GCS_BUCKET_NAME: str = os.getenv("GCS_BUCKET_NAME", "")
     SERVICE_ACCOUNT_B64: Optional[str] = os.getenv("SERVICE_ACCOUNT_B64")
+    GCS_LIST_CACHE_TTL_SECONDS: int = 60  # Reuse bucket listings this long before refreshing; 0 disables
+    SIGNED_URL_PREWARM_COUNT: int = 20  # Upcoming audio files to pre-sign after a signed URL cache miss; 0 disables
+    IO_THREAD_POOL_SIZE: int = 32  # Worker threads for blocking GCS and file processing calls
     
     # CORS settings
     ALLOWED_HOSTS: List[str] = ["*"]
@@ -45,7 +54,10 @@ class Settings(BaseSettings):
     
     # Transcription collection settings
     MAX_TRANSCRIPTIONS_PER_AUDIO: int = 1  # Number of transcriptions per audio file
+    MAX_BULK_TRANSCRIPTIONS: int = 500  # Maximum items accepted by POST /transcription/bulk
     AUDIO_LEASE_TIMEOUT_MINUTES: int = 15  # Audio file lease timeout in minutes
+    AUDIO_QUEUE_RECHECK_SECONDS: int = 30  # Max time to trust an empty queue without a NOTIFY
+    LEADERBOARD_CACHE_TTL_SECONDS: int = 30  # Reuse serialized leaderboard responses this long; 0 disables
 
     class Config:
         """Pydantic configuration class."""
@@ -6,6 +6,7 @@ with asyncpg driver for PostgreSQL. It includes connection lifecycle
 management and session factory for dependency injection.
 """
 
+import asyncio
 import logging
 from typing import AsyncGenerator
 
@@ -29,16 +30,48 @@ class Base(DeclarativeBase):
     pass
 
 
-# Convert standard PostgreSQL URL to asyncpg format
-ASYNC_DATABASE_URL = settings.DATABASE_URL.replace(
-    "postgresql://", "postgresql+asyncpg://"
+# Convert standard (or psycopg2) PostgreSQL URLs to the native asyncpg driver
+ASYNC_DATABASE_URL = (
+    settings.DATABASE_URL
+    .replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+    .replace("postgresql://", "postgresql+asyncpg://", 1)
+    .replace("postgres://", "postgresql+asyncpg://", 1)
 )
 
+if settings.DB_POOL_SIZE > 0:
+    # Long-running servers keep warm connections and recycle stale ones
+    _POOL_OPTIONS = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+else:
+    _POOL_OPTIONS = {"poolclass": NullPool}  # Use NullPool for serverless/lambda deployments
+
+# JIT compilation costs more than it saves on these short OLTP queries
+_SERVER_SETTINGS = {"jit": "off"}
+# Bound runaway queries and abandoned transactions so they can't pin connections
+if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+    _SERVER_SETTINGS["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+if settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS > 0:
+    _SERVER_SETTINGS["idle_in_transaction_session_timeout"] = str(settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS)
+
 # Create async database engine with connection pooling
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
     echo=settings.DEBUG,
-    poolclass=NullPool,  # Use NullPool for serverless/lambda deployments
+    **_POOL_OPTIONS,
+    insertmanyvalues_page_size=1000,  # Rows per multi-row INSERT for bulk executemany
+    query_cache_size=1200,  # Compiled SQL cache entries, sized above the default 500
+    connect_args={
+        # Fail fast on network stalls instead of waiting for the OS TCP timeout
+        "timeout": settings.DB_CONNECT_TIMEOUT_SECONDS,
+        "server_settings": _SERVER_SETTINGS,
+        # Reuse server-side prepared statements for the hot, fixed-text queries
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 
 # Create async session factory
@@ -63,13 +96,44 @@ async def get_async_database_session() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+# Tables the service queries; the startup probe reports any that are missing
+_REQUIRED_TABLES = ("Audio", "Transcriptions", "AdminDailyCounts")
+
+# Doubles as the connectivity check, so verifying tables costs no extra round trip
+_MISSING_TABLES_SQL = text("""
+    SELECT array_agg(name)
+    FROM unnest(CAST(:names AS text[])) AS name
+    WHERE to_regclass(format('public.%I', name)) IS NULL
+""").bindparams(names=list(_REQUIRED_TABLES))
+
+
+async def _check_connection() -> list:
+    """
+    Open a connection, probe it and return it to the pool.
+    
+    Returns:
+        Names of required tables missing from the public schema
+    """
+    async with async_engine.connect() as conn:
+        # Read-only probe: autocommit skips the BEGIN and ROLLBACK round trips
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        result = await conn.execute(_MISSING_TABLES_SQL)
+        return result.scalar() or []
+
+
 async def init_database() -> None:
-    """Initialize database connection (async) and verify connectivity."""
+    """
+    Initialize database connection (async) and verify connectivity.
+    
+    With pooling enabled, DB_POOL_SIZE connections are opened concurrently so
+    the first requests don't pay the connect and auth handshake.
+    """
     try:
-        async with async_engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
-            logger.info("Async database connection established successfully")
-            logger.info("Connected to database")
+        checks = await asyncio.gather(*(_check_connection() for _ in range(max(settings.DB_POOL_SIZE, 1))))
+        logger.info("Async database connection established successfully")
+        if checks[0]:
+            logger.warning(f"Database is missing tables: {', '.join(checks[0])} (see DEPLOYMENT.md)")
+        logger.info("Connected to database")
     except Exception as e:
         logger.error(f"Failed to initialize async database: {e}")
         raise
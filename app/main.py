@@ -9,11 +9,14 @@ speech recognition transcriptions.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
 
 from app.core.config import settings
 from app.core.database import init_database, close_database
 from app.core.gcp_auth import gcp_auth_manager
+from app.services.audio_availability import audio_availability
 from app.api.v1.api import api_router
 
 # Configure logging
@@ -23,6 +26,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Don't let a stalled database hold up worker shutdown past this many seconds
+_DB_CLOSE_TIMEOUT_SECONDS = 5
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -33,6 +39,13 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up Sinhala ASR Dataset Creation Service")
     
+    # Blocking GCS and CSV work runs via asyncio.to_thread on the default executor
+    io_executor = ThreadPoolExecutor(
+        max_workers=settings.IO_THREAD_POOL_SIZE,
+        thread_name_prefix="io",
+    )
+    asyncio.get_running_loop().set_default_executor(io_executor)
+    
     # Setup GCP credentials first
     try:
         gcp_auth_manager.setup_credentials()
@@ -48,13 +61,19 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}")
         raise
     
+    await audio_availability.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Sinhala ASR Dataset Creation Service")
+    await audio_availability.stop()
+    
     try:
-        await close_database()
+        await asyncio.wait_for(close_database(), timeout=_DB_CLOSE_TIMEOUT_SECONDS)
         logger.info("Database connection closed successfully")
+    except asyncio.TimeoutError:
+        logger.warning(f"Database connections not closed within {_DB_CLOSE_TIMEOUT_SECONDS}s, continuing shutdown")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
     
@@ -64,6 +83,8 @@ async def lifespan(app: FastAPI):
         logger.info("GCP resources cleaned up successfully")
     except Exception as e:
         logger.error(f"Error cleaning up GCP resources: {e}")
+    
+    io_executor.shutdown(wait=False)
 
 
 app = FastAPI(
@@ -5,7 +5,7 @@ This module defines SQLAlchemy ORM models for audio files and transcriptions
 with proper relationships, indexing, and data validation constraints.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, Text, ForeignKey, Integer, Enum, Time, Float
+from sqlalchemy import Column, String, Boolean, DateTime, Text, ForeignKey, Integer, Enum, Time, Float, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -35,6 +35,16 @@ class Audio(Base):
         transcriptions: Relationship to user transcriptions
     """
     __tablename__ = "Audio"
+    __table_args__ = (
+        # Matches the claim query's ORDER BY so SKIP LOCKED walks the index in
+        # order; leased_until is included to filter expired leases from the index
+        Index(
+            "audio_claim_idx",
+            "transcription_count",
+            "audio_id",
+            postgresql_include=["leased_until"],
+        ),
+    )
     
     audio_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     audio_filename = Column(Text, nullable=False, unique=True, index=True)
@@ -79,6 +89,15 @@ class Transcriptions(Base):
         audio: Relationship back to the audio file
     """
     __tablename__ = "Transcriptions"
+    __table_args__ = (
+        # Partial index over the validation backlog: serves the pending count
+        # and the oldest-first ordering of the validation queue
+        Index(
+            "transcriptions_pending_validation_idx",
+            "created_at",
+            postgresql_where=text("is_audio_suitable AND validated_at IS NULL"),
+        ),
+    )
     
     trans_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     
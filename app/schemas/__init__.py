@@ -155,6 +155,8 @@ class FileMetadata(BaseModel):
     md5_hash: str = Field(..., description="MD5 hash of the file")
     is_audio_file: bool = Field(..., description="Whether the file is an audio file")
 
+    model_config = ConfigDict(from_attributes=True)
+
 
 class FilesListResponse(BaseModel):
     """
@@ -164,6 +166,7 @@ class FilesListResponse(BaseModel):
     audio_files: int = Field(..., description="Number of audio files")
     other_files: int = Field(..., description="Number of non-audio files")
     files: List[FileMetadata] = Field(..., description="List of file metadata")
+    next_page_token: Optional[str] = Field(None, description="Token for the next page when paginating, None on the last page")
 
 
 class AudioFileComparisonItem(BaseModel):
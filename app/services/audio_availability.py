@@ -0,0 +1,152 @@
+"""
+Audio availability tracking via PostgreSQL LISTEN/NOTIFY.
+
+This module keeps a per-process hint of whether any audio may be claimable.
+Once a claim finds the queue empty, further claims short-circuit without
+touching the database until an `audio_ready` notification arrives (fired by
+a trigger on the "Audio" table) or a fallback interval elapses, which also
+covers leases that expire silently.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import asyncpg
+
+from app.core.config import settings
+from app.core.database import async_engine
+
+logger = logging.getLogger(__name__)
+
+AUDIO_READY_CHANNEL = "audio_ready"
+
+# Delay between attempts to reopen a lost listener connection
+_RECONNECT_DELAY_SECONDS = 5
+
+
+class AudioAvailabilityMonitor:
+    """
+    Tracks whether the transcription queue is known to be empty.
+
+    Holds a dedicated asyncpg connection that LISTENs on the audio_ready
+    channel. If the listener cannot be started or its connection drops, the
+    monitor keeps working on the fallback interval alone and reconnects in
+    the background.
+    """
+
+    def __init__(self):
+        """Initialize with no listener and the queue assumed non-empty."""
+        self._connection: Optional[asyncpg.Connection] = None
+        self._empty_since: Optional[float] = None
+        # Bumped on every wakeup so a claim that started earlier cannot re-mark the queue empty
+        self._generation = 0
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Open the listener connection and subscribe to audio_ready."""
+        self._stopping = False
+        if not await self._connect():
+            self._schedule_reconnect()
+
+    async def stop(self) -> None:
+        """Stop reconnecting, unsubscribe and close the listener connection."""
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._connection is None:
+            return
+        try:
+            await self._connection.remove_listener(AUDIO_READY_CHANNEL, self._on_audio_ready)
+            await self._connection.close()
+            logger.info("Audio availability listener closed")
+        except Exception as e:
+            logger.warning("Error closing audio availability listener: %s", e)
+        finally:
+            self._connection = None
+
+    async def _connect(self) -> bool:
+        """Open a listener connection; return False if it could not be set up."""
+        try:
+            dsn = async_engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+            connection = await asyncpg.connect(dsn, timeout=settings.DB_CONNECT_TIMEOUT_SECONDS)
+            await connection.add_listener(AUDIO_READY_CHANNEL, self._on_audio_ready)
+            connection.add_termination_listener(self._on_connection_lost)
+            self._connection = connection
+            logger.info("Listening for '%s' notifications", AUDIO_READY_CHANNEL)
+            return True
+        except Exception as e:
+            self._connection = None
+            logger.warning("Audio availability listener unavailable, using fallback interval only: %s", e)
+            return False
+
+    def _schedule_reconnect(self) -> None:
+        """Start the background reconnect loop unless it is already running."""
+        if self._stopping or self._reconnect_task is not None:
+            return
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """Retry the listener connection until it succeeds or the monitor stops."""
+        try:
+            while not self._stopping:
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+                if await self._connect():
+                    return
+        finally:
+            self._reconnect_task = None
+
+    def _on_connection_lost(self, connection) -> None:
+        """asyncpg termination callback: the listener connection closed."""
+        if self._stopping:
+            return
+        self._connection = None
+        # Notifications sent while disconnected are lost; stop trusting the empty flag
+        self._wake()
+        logger.warning("Audio availability listener connection lost, reconnecting")
+        self._schedule_reconnect()
+
+    def may_have_audio(self) -> bool:
+        """Return False only while the queue is known to be empty."""
+        if self._empty_since is None:
+            return True
+        if time.monotonic() - self._empty_since >= settings.AUDIO_QUEUE_RECHECK_SECONDS:
+            self._empty_since = None
+            return True
+        return False
+
+    @property
+    def generation(self) -> int:
+        """Wakeup counter; read it before probing the queue and pass it to mark_empty()."""
+        return self._generation
+
+    def mark_empty(self, generation: int) -> None:
+        """
+        Record that a claim attempt found no claimable audio.
+        
+        Ignored if audio became available since `generation` was read, so a
+        notification that arrives while the probe is running is not lost.
+        """
+        if generation != self._generation:
+            return
+        self._empty_since = time.monotonic()
+
+    def mark_available(self) -> None:
+        """Record that this process made audio claimable (e.g. imported new rows)."""
+        self._wake()
+
+    def _on_audio_ready(self, connection, pid, channel, payload) -> None:
+        """asyncpg listener callback: audio may be claimable again."""
+        self._wake()
+
+    def _wake(self) -> None:
+        """Clear the empty flag and invalidate claims already in flight."""
+        self._generation += 1
+        self._empty_since = None
+
+
+# Global audio availability monitor
+audio_availability = AudioAvailabilityMonitor()
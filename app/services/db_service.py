@@ -6,22 +6,305 @@ transaction management, and concurrency safety. All operations use async
 SQLAlchemy sessions for optimal performance.
 """
 
+import asyncio
+import csv
 import logging
-from typing import Optional, List, Tuple
+from dataclasses import dataclass
+from typing import Optional, List, Tuple, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text, func
-from uuid import UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import select, text, func, insert, bindparam, Row, RowMapping
+from uuid import UUID, uuid4
 from io import StringIO
-import pandas as pd
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
 
 from app.models import Audio, Transcriptions
 from app.schemas import TranscriptionCreate, TranscriptionValidationUpdate
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.services.gcs_service import gcs_service
+from app.services.audio_availability import audio_availability
 
 logger = logging.getLogger(__name__)
 
+# Background signed URL prewarm in flight, if any (one per process)
+_prewarm_task: Optional[asyncio.Task] = None
+
+
+@dataclass(slots=True)
+class AudioRow:
+    """Lightweight audio record returned by raw-SQL claim queries."""
+    audio_id: UUID
+    audio_filename: str
+    google_transcription: Optional[str]
+    transcription_count: int
+    leased_until: Optional[datetime]
+
+
+@dataclass(slots=True)
+class TranscriptionRow:
+    """Lightweight transcription record returned by raw-SQL claim queries."""
+    trans_id: UUID
+    audio_id: UUID
+    transcription: str
+    speaker_gender: Optional[str]
+    has_noise: Optional[bool]
+    is_code_mixed: Optional[bool]
+    is_speaker_overlappings_exist: Optional[bool]
+    is_audio_suitable: Optional[bool]
+    admin: Optional[str]
+    validated_at: Optional[datetime]
+    created_at: Optional[datetime]
+
+
+# Lease length is fixed for the process lifetime; bound as a native interval
+_LEASE_DURATION = timedelta(minutes=settings.AUDIO_LEASE_TIMEOUT_MINUTES)
+
+# Raw SQL statements are compiled once at import time and reused per call
+_CLAIM_AUDIO_SQL = text("""
+    UPDATE "Audio" 
+    SET leased_until = NOW() + CAST(:lease_duration AS INTERVAL)
+    WHERE audio_id = (
+        SELECT audio_id 
+        FROM "Audio" 
+        WHERE transcription_count < :max_transcriptions
+        AND (leased_until IS NULL OR leased_until < NOW())
+        ORDER BY transcription_count ASC, audio_id
+        FOR UPDATE SKIP LOCKED
+        LIMIT 1
+    )
+    RETURNING audio_id, audio_filename, google_transcription, transcription_count, leased_until;
+""")
+
+_CLAIMABLE_AUDIO_EXISTS_SQL = text("""
+    SELECT EXISTS (
+        SELECT 1
+        FROM "Audio"
+        WHERE transcription_count < :max_transcriptions
+        AND (leased_until IS NULL OR leased_until < NOW())
+    );
+""")
+
+_UPCOMING_AUDIO_FILENAMES_SQL = text("""
+    SELECT audio_filename
+    FROM "Audio"
+    WHERE transcription_count < :max_transcriptions
+    AND (leased_until IS NULL OR leased_until < NOW())
+    ORDER BY transcription_count ASC, audio_id
+    LIMIT :limit;
+""")
+
+_RELEASE_AUDIO_SQL = text("""
+    UPDATE "Audio" 
+    SET leased_until = NOW()
+    WHERE audio_id = :audio_id
+    RETURNING audio_id;
+""")
+
+_CREATE_UNSUITABLE_TRANSCRIPTION_SQL = text("""
+    WITH upd AS (
+        UPDATE "Audio" a
+        SET audio_filename = 'not_suitable',
+            google_transcription = 'Audio not suitable for transcription',
+            start_time = NULL,
+            end_time = NULL,
+            padded_duration = NULL,
+            created_at = NULL
+        FROM (
+            SELECT audio_id, audio_filename
+            FROM "Audio"
+            WHERE audio_id = :audio_id
+            FOR UPDATE
+        ) original
+        WHERE a.audio_id = original.audio_id
+        RETURNING original.audio_filename AS original_filename
+    ), ins AS (
+        INSERT INTO "Transcriptions" (
+            trans_id, audio_id, transcription, speaker_gender, has_noise,
+            is_code_mixed, is_speaker_overlappings_exist, is_audio_suitable,
+            admin, validated_at, created_at
+        )
+        VALUES (
+            :trans_id, :audio_id, :transcription, NULL, NULL,
+            NULL, NULL, FALSE,
+            NULL, NULL, NULL
+        )
+        RETURNING trans_id, audio_id, transcription, speaker_gender, has_noise,
+            is_code_mixed, is_speaker_overlappings_exist, is_audio_suitable,
+            admin, validated_at, created_at
+    )
+    SELECT ins.*, (SELECT original_filename FROM upd) AS original_filename
+    FROM ins;
+""")
+
+_CREATE_TRANSCRIPTION_AND_RELEASE_SQL = text("""
+    WITH ins AS (
+        INSERT INTO "Transcriptions" (
+            trans_id, audio_id, transcription, speaker_gender, has_noise,
+            is_code_mixed, is_speaker_overlappings_exist, is_audio_suitable,
+            admin, validated_at
+        )
+        VALUES (
+            :trans_id, :audio_id, :transcription, :speaker_gender, :has_noise,
+            :is_code_mixed, :is_speaker_overlappings_exist, :is_audio_suitable,
+            :admin, :validated_at
+        )
+        RETURNING trans_id, audio_id, transcription, speaker_gender, has_noise,
+            is_code_mixed, is_speaker_overlappings_exist, is_audio_suitable,
+            admin, validated_at, created_at
+    ), released AS (
+        UPDATE "Audio"
+        SET leased_until = NOW()
+        WHERE audio_id = (SELECT audio_id FROM ins)
+    )
+    SELECT * FROM ins;
+""")
+
+_VALIDATE_TRANSCRIPTION_SQL = text("""
+    WITH upd AS (
+        UPDATE "Transcriptions"
+        SET transcription = :transcription,
+            speaker_gender = :speaker_gender,
+            has_noise = :has_noise,
+            is_code_mixed = :is_code_mixed,
+            is_speaker_overlappings_exist = :is_speaker_overlappings_exist,
+            is_audio_suitable = COALESCE(:is_audio_suitable, is_audio_suitable),
+            validated_at = NOW()
+        WHERE trans_id = :trans_id
+        RETURNING trans_id, audio_id, transcription, speaker_gender, has_noise,
+            is_code_mixed, is_speaker_overlappings_exist, is_audio_suitable,
+            admin, validated_at, created_at
+    ), released AS (
+        UPDATE "Audio"
+        SET leased_until = NOW()
+        FROM upd
+        WHERE "Audio".audio_id = upd.audio_id
+    )
+    SELECT * FROM upd;
+""")
+
+_VALIDATE_UNSUITABLE_TRANSCRIPTION_SQL = text("""
+    WITH upd AS (
+        UPDATE "Transcriptions"
+        SET transcription = :transcription,
+            speaker_gender = NULL,
+            has_noise = NULL,
+            is_code_mixed = NULL,
+            is_speaker_overlappings_exist = NULL,
+            is_audio_suitable = FALSE,
+            validated_at = NULL,
+            created_at = NULL
+        WHERE trans_id = :trans_id
+        RETURNING trans_id, audio_id, transcription, speaker_gender, has_noise,
+            is_code_mixed, is_speaker_overlappings_exist, is_audio_suitable,
+            admin, validated_at, created_at
+    ), audio_upd AS (
+        UPDATE "Audio" a
+        SET audio_filename = 'not_suitable',
+            google_transcription = 'Audio not suitable for transcription',
+            start_time = NULL,
+            end_time = NULL,
+            padded_duration = NULL,
+            created_at = NULL,
+            leased_until = NOW()
+        FROM (
+            SELECT "Audio".audio_id, "Audio".audio_filename
+            FROM "Audio"
+            JOIN upd ON "Audio".audio_id = upd.audio_id
+            FOR UPDATE OF "Audio"
+        ) original
+        WHERE a.audio_id = original.audio_id
+        RETURNING original.audio_filename AS original_filename
+    )
+    SELECT upd.*, (SELECT original_filename FROM audio_upd) AS original_filename
+    FROM upd;
+""")
+
+_CLAIM_NEXT_UNVALIDATED_SQL = text("""
+    WITH candidate AS (
+        SELECT 
+            t.trans_id, t.audio_id, t.transcription, t.speaker_gender, 
+            t.has_noise, t.is_code_mixed, t.is_speaker_overlappings_exist, 
+            t.is_audio_suitable, t.admin, t.validated_at, t.created_at
+        FROM "Transcriptions" t
+        JOIN "Audio" a ON t.audio_id = a.audio_id
+        WHERE t.is_audio_suitable = TRUE
+            AND t.validated_at IS NULL
+            AND (a.leased_until IS NULL OR a.leased_until < NOW())
+        ORDER BY t.created_at ASC
+        LIMIT 1
+        FOR UPDATE OF t, a SKIP LOCKED
+    )
+    UPDATE "Audio" a
+    SET leased_until = NOW() + CAST(:lease_duration AS INTERVAL)
+    FROM candidate c
+    WHERE a.audio_id = c.audio_id
+    RETURNING 
+        c.trans_id, c.audio_id, c.transcription, c.speaker_gender, 
+        c.has_noise, c.is_code_mixed, c.is_speaker_overlappings_exist, 
+        c.is_audio_suitable, c.admin, c.validated_at, c.created_at,
+        a.audio_id, a.audio_filename, a.google_transcription, 
+        a.transcription_count, a.leased_until;
+""")
+
+# CSV imports larger than this are loaded with COPY into a staging table
+_COPY_THRESHOLD = 500
+
+# Large CSV imports can outlast DB_STATEMENT_TIMEOUT_MS, which is sized for
+# request-path queries; lifted for the import transaction only
+_DISABLE_STATEMENT_TIMEOUT_SQL = text("SET LOCAL statement_timeout = 0;")
+
+_CREATE_AUDIO_STAGE_SQL = text("""
+    CREATE TEMP TABLE audio_stage (
+        audio_filename TEXT,
+        google_transcription TEXT
+    ) ON COMMIT DROP;
+""")
+
+_INSERT_FROM_AUDIO_STAGE_SQL = text("""
+    INSERT INTO "Audio" (audio_id, audio_filename, google_transcription, transcription_count)
+    SELECT gen_random_uuid(), audio_filename, google_transcription, 0
+    FROM audio_stage
+    ON CONFLICT (audio_filename) DO NOTHING
+    RETURNING audio_filename;
+""")
+
+# ORM statements are likewise built once; per-call values are bound parameters
+_ALL_AUDIO_STMT = (
+    select(
+        Audio.audio_id,
+        Audio.audio_filename,
+        Audio.google_transcription,
+        Audio.transcription_count,
+    )
+    .execution_options(yield_per=1000)
+)
+
+_AUDIO_PAGE_STMT = select(Audio).order_by(Audio.audio_id).limit(bindparam("limit"))
+
+_TRANSCRIPTIONS_FOR_AUDIO_STMT = (
+    select(
+        Transcriptions.trans_id,
+        Transcriptions.transcription,
+        Transcriptions.speaker_gender,
+        Transcriptions.is_audio_suitable,
+        Transcriptions.validated_at,
+        Transcriptions.created_at,
+    )
+    .where(Transcriptions.audio_id == bindparam("audio_id"))
+    .execution_options(yield_per=200)
+)
+
+# Both counts share one scan via aggregate FILTER clauses
+_VALIDATION_PROGRESS_COUNTS_STMT = (
+    select(
+        func.count().filter(Transcriptions.validated_at.is_(None)).label("pending"),
+        func.count().label("total"),
+    )
+    .select_from(Transcriptions)
+    .where(Transcriptions.is_audio_suitable.is_(True))
+)
+
 
 class AudioService:
     """Service for audio database operations."""
@@ -29,7 +312,7 @@ class AudioService:
 
 
     @staticmethod
-    async def claim_audio_for_transcription(db: AsyncSession) -> Optional[Audio]:
+    async def claim_audio_for_transcription(db: AsyncSession) -> Optional[AudioRow]:
         """
         Atomically claim an audio file for transcription using lease-based system.
         
@@ -43,53 +326,47 @@ class AudioService:
         3. Lock and claim one row atomically
         4. Set lease expiration timestamp
         
+        A cheap lock-free EXISTS probe runs first so that polling an empty
+        queue never takes row locks or issues a write. Once the queue is found
+        empty, claims return immediately until an audio_ready notification
+        arrives or the recheck interval elapses.
+        
         Returns:
-            Optional[Audio]: Claimed audio file or None if no files available
+            Optional[AudioRow]: Claimed audio file or None if no files available
         """
+        if not audio_availability.may_have_audio():
+            logger.info("No audio files available for claiming (queue known empty)")
+            return None
+
+        # Read before probing: a wakeup during the probe must win over mark_empty()
+        generation = audio_availability.generation
         try:
+            # Fast path: skip the locking UPDATE when nothing is claimable
+            probe = await db.execute(_CLAIMABLE_AUDIO_EXISTS_SQL, {
+                "max_transcriptions": settings.MAX_TRANSCRIPTIONS_PER_AUDIO,
+            })
+            if not probe.scalar_one():
+                await db.rollback()
+                audio_availability.mark_empty(generation)
+                logger.info("No audio files available for claiming")
+                return None
+
             # Use a raw SQL query for optimal performance with FOR UPDATE SKIP LOCKED
-            query = text(f"""
-                UPDATE "Audio" 
-                SET leased_until = NOW() + INTERVAL '{settings.AUDIO_LEASE_TIMEOUT_MINUTES} minutes'
-                WHERE audio_id = (
-                    SELECT audio_id 
-                    FROM "Audio" 
-                    WHERE transcription_count < {settings.MAX_TRANSCRIPTIONS_PER_AUDIO}
-                    AND (leased_until IS NULL OR leased_until < NOW())
-                    ORDER BY transcription_count ASC, audio_id
-                    FOR UPDATE SKIP LOCKED
-                    LIMIT 1
-                )
-                RETURNING audio_id, audio_filename, google_transcription, transcription_count, leased_until;
-            """)
-            
-            result = await db.execute(query)
-            audio_row = result.fetchone()
+            result = await db.execute(_CLAIM_AUDIO_SQL, {
+                "max_transcriptions": settings.MAX_TRANSCRIPTIONS_PER_AUDIO,
+                "lease_duration": _LEASE_DURATION,
+            })
+            audio_row = result.one_or_none()
             
             if audio_row:
                 await db.commit()
                 
-                # Convert the row to an Audio object-like structure
-                audio_data = {
-                    'audio_id': audio_row[0],
-                    'audio_filename': audio_row[1], 
-                    'google_transcription': audio_row[2],
-                    'transcription_count': audio_row[3],
-                    'leased_until': audio_row[4]
-                }
+                # RETURNING columns follow the AudioRow field order
+                claimed_audio = AudioRow(*audio_row)
                 
-                logger.info(f"Successfully claimed audio for transcription: {audio_data['audio_filename']} (lease until: {audio_data['leased_until']}, timeout: {settings.AUDIO_LEASE_TIMEOUT_MINUTES} minutes)")
+                logger.info("Successfully claimed audio for transcription: %s (lease until: %s, timeout: %s minutes)", claimed_audio.audio_filename, claimed_audio.leased_until, settings.AUDIO_LEASE_TIMEOUT_MINUTES)
                 
-                # Create a minimal Audio-like object for compatibility
-                class ClaimedAudio:
-                    def __init__(self, data):
-                        self.audio_id = data['audio_id']
-                        self.audio_filename = data['audio_filename']
-                        self.google_transcription = data['google_transcription']
-                        self.transcription_count = data['transcription_count']
-                        self.leased_until = data['leased_until']
-                
-                return ClaimedAudio(audio_data)
+                return claimed_audio
             else:
                 await db.rollback()
                 logger.info("No audio files available for claiming")
@@ -97,11 +374,11 @@ class AudioService:
                 
         except Exception as e:
             await db.rollback()
-            logger.error(f"Error claiming audio for transcription: {e}")
+            logger.error("Error claiming audio for transcription: %s", e)
             raise
 
     @staticmethod
-    async def get_random_audio_for_transcription(db: AsyncSession) -> Optional[Audio]:
+    async def get_random_audio_for_transcription(db: AsyncSession) -> Optional[AudioRow]:
         """
         Get an audio file for transcription using the lease-based claiming system.
         
@@ -109,36 +386,41 @@ class AudioService:
         race conditions through database-level locking and lease management.
         
         Returns:
-            Optional[Audio]: Claimed audio file or None if no files available
+            Optional[AudioRow]: Claimed audio file or None if no files available
         """
         return await AudioService.claim_audio_for_transcription(db)
 
     @staticmethod
-    async def lease_audio_for_validation(db: AsyncSession, audio_id: UUID) -> bool:
-        """Lease an audio item while it is under validation."""
-        try:
-            query = text(f"""
-                UPDATE "Audio"
-                SET leased_until = NOW() + INTERVAL '{settings.AUDIO_LEASE_TIMEOUT_MINUTES} minutes'
-                WHERE audio_id = :audio_id
-                RETURNING audio_id;
-            """)
-            result = await db.execute(query, {"audio_id": audio_id})
-            row = result.fetchone()
-
-            if row:
-                await db.commit()
-                logger.info(f"Leased audio {audio_id} for validation")
-                return True
-
-            await db.rollback()
-            logger.warning(f"Attempted to lease audio for validation but no audio found: {audio_id}")
-            return False
+    def schedule_signed_url_prewarm() -> None:
+        """
+        Start signing URLs for the next audio files in claim order.
+        
+        Runs in the background with its own session so upcoming claims find
+        their URL in the signed URL cache. Does nothing when disabled or when
+        a prewarm is already running.
+        """
+        global _prewarm_task
+        if settings.SIGNED_URL_PREWARM_COUNT <= 0:
+            return
+        if _prewarm_task is not None and not _prewarm_task.done():
+            return
+        _prewarm_task = asyncio.create_task(AudioService._prewarm_signed_urls())
 
+    @staticmethod
+    async def _prewarm_signed_urls() -> None:
+        """Sign URLs for the next SIGNED_URL_PREWARM_COUNT claimable audio files."""
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(_UPCOMING_AUDIO_FILENAMES_SQL, {
+                    "max_transcriptions": settings.MAX_TRANSCRIPTIONS_PER_AUDIO,
+                    "limit": settings.SIGNED_URL_PREWARM_COUNT,
+                })
+                filenames = result.scalars().all()
+            
+            await asyncio.gather(*(gcs_service.generate_signed_url(filename) for filename in filenames))
+            logger.info("Prewarmed signed URLs for %s upcoming audio files", len(filenames))
         except Exception as e:
-            await db.rollback()
-            logger.error(f"Error leasing audio {audio_id} for validation: {e}")
-            raise
+            logger.warning("Signed URL prewarm failed: %s", e)
 
     @staticmethod
     async def release_audio_lease(db: AsyncSession, audio_id: UUID) -> bool:
@@ -157,44 +439,67 @@ class AudioService:
             bool: True if lease was released successfully, False otherwise
         """
         try:
-            query = text("""
-                UPDATE "Audio" 
-                SET leased_until = NOW()
-                WHERE audio_id = :audio_id
-                RETURNING audio_id;
-            """)
-            
-            result = await db.execute(query, {"audio_id": audio_id})
-            updated_row = result.fetchone()
+            result = await db.execute(_RELEASE_AUDIO_SQL, {"audio_id": audio_id})
+            released_id = result.scalar_one_or_none()
             
-            if updated_row:
+            if released_id:
                 await db.commit()
-                logger.info(f"Successfully released lease for audio: {audio_id}")
+                audio_availability.mark_available()
+                logger.info("Successfully released lease for audio: %s", audio_id)
                 return True
             else:
                 await db.rollback()
-                logger.warning(f"No audio found with ID: {audio_id}")
+                logger.warning("No audio found with ID: %s", audio_id)
                 return False
                 
         except Exception as e:
             await db.rollback()
-            logger.error(f"Error releasing audio lease for {audio_id}: {e}")
+            logger.error("Error releasing audio lease for %s: %s", audio_id, e)
             raise
 
     @staticmethod
-    async def get_all_audio_files(db: AsyncSession) -> List[Audio]:
-        """Get all audio files from the database."""
+    async def get_all_audio_files(db: AsyncSession) -> AsyncIterator[Row]:
+        """
+        Stream all audio files from the database.
+        
+        Only the columns needed for bucket comparison are selected as plain
+        rows (no ORM instances), fetched from a server-side cursor in batches
+        so the whole Audio table is never held in memory at once.
+        """
         try:
-            result = await db.execute(select(Audio))
-            audio_files = result.scalars().all()
-            logger.info(f"Retrieved {len(audio_files)} audio files from database")
-            return audio_files
+            result = await db.stream(_ALL_AUDIO_STMT)
+            async for audio in result:
+                yield audio
+        except Exception as e:
+            logger.error("Error getting all audio files: %s", e)
+            raise
+
+    @staticmethod
+    async def get_all_audio_files_paginated(
+        db: AsyncSession,
+        limit: int,
+        after_audio_id: Optional[UUID] = None,
+    ) -> List[Audio]:
+        """
+        Get one page of audio files ordered by audio_id.
+        
+        Uses keyset pagination: pass the last audio_id of the previous page as
+        after_audio_id to fetch the next page.
+        """
+        stmt = _AUDIO_PAGE_STMT
+        params = {"limit": limit}
+        if after_audio_id is not None:
+            stmt = stmt.where(Audio.audio_id > bindparam("after_audio_id"))
+            params["after_audio_id"] = after_audio_id
+        try:
+            result = await db.execute(stmt, params)
+            return result.scalars().all()
         except Exception as e:
-            logger.error(f"Error getting all audio files: {e}")
+            logger.error("Error getting audio files page: %s", e)
             raise
 
     @staticmethod
-    async def bulk_insert_from_csv(db: AsyncSession, csv_content: str) -> Tuple[int, int, List[str]]:
+    async def bulk_insert_from_csv(db: AsyncSession, csv_content: str) -> Tuple[int, int, List[dict]]:
         """
         Bulk insert audio records from CSV file content.
         
@@ -212,62 +517,109 @@ class AudioService:
         Returns:
             Tuple containing (inserted_count, skipped_count, skipped_files_list)
         """
-        inserted = 0
-        skipped = 0
-        skipped_files: List[str] = []
-
         try:
-            df = pd.read_csv(StringIO(csv_content))
+            # Parse in a worker thread so large uploads don't block the event loop
+            entries, records = await asyncio.to_thread(AudioService._parse_audio_csv, csv_content)
 
-            required_columns = ["filename", "transcription"]
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
+            # Everything runs inside one explicit transaction (one commit)
+            inserted_filenames = set()
+            if len(records) > _COPY_THRESHOLD:
+                async with db.begin():
+                    await db.execute(_DISABLE_STATEMENT_TIMEOUT_SQL)
+                    inserted_filenames = await AudioService._copy_insert_audio(db, records)
+            elif records:
+                # Single executemany; SQLAlchemy batches it into multi-row VALUES pages
+                rows_to_insert = [
+                    {
+                        "audio_filename": filename,
+                        "google_transcription": transcription,
+                        "transcription_count": 0,
+                    }
+                    for filename, transcription in records
+                ]
+                insert_stmt = (
+                    pg_insert(Audio)
+                    .on_conflict_do_nothing(index_elements=[Audio.audio_filename])
+                    .returning(Audio.audio_filename)
+                )
+                async with db.begin():
+                    await db.execute(_DISABLE_STATEMENT_TIMEOUT_SQL)
+                    insert_result = await db.execute(insert_stmt, rows_to_insert)
+                    inserted_filenames = set(insert_result.scalars().all())
+            inserted = len(inserted_filenames)
+            if inserted:
+                # Don't wait for an audio_ready notification (or the trigger may be absent)
+                audio_availability.mark_available()
 
-            # Normalize filenames and collect the set for a single DB lookup
-            df["filename"] = df["filename"].astype(str).str.strip()
-            filenames = {fn for fn in df["filename"].tolist() if fn}
+            # Every row that did not produce an insert is reported as skipped
+            skipped_files = [
+                {"row": row_number, "filename": filename}
+                for row_number, filename, is_candidate in entries
+                if not (is_candidate and filename in inserted_filenames)
+            ]
+            skipped = len(skipped_files)
 
-            if filenames:
-                existing_result = await db.execute(
-                    select(Audio.audio_filename).where(Audio.audio_filename.in_(filenames))
-                )
-                existing_filenames = set(existing_result.scalars().all())
-            else:
-                existing_filenames = set()
+            logger.info("Bulk insert completed: %s inserted, %s skipped", inserted, skipped)
+            return inserted, skipped, skipped_files
 
-            for index, row in df.iterrows():
-                filename = str(row["filename"]).strip() if pd.notna(row["filename"]) else ""
-                transcription = (
-                    str(row["transcription"]).strip() if pd.notna(row["transcription"]) else None
-                )
+        except Exception as e:
+            # db.begin() has already rolled back the transaction on failure
+            logger.error("Error during bulk insert: %s", e)
+            raise
 
-                if not filename:
-                    skipped += 1
-                    skipped_files.append({"row": index + 1, "filename": filename})
-                    continue
+    @staticmethod
+    def _parse_audio_csv(csv_content: str) -> Tuple[List[Tuple[int, str, bool]], List[Tuple[str, Optional[str]]]]:
+        """
+        Parse audio CSV content into per-row entries and insert candidates.
+        
+        Returns (entries, records): entries holds (row_number, filename,
+        is_candidate) for every data row, and records holds the
+        (filename, transcription) pairs to insert. Only empty filenames and
+        repeats within the CSV are dropped here; filenames already in the
+        database are resolved by ON CONFLICT.
+        """
+        # Excel's "CSV UTF-8" export starts with a byte-order mark, which
+        # would otherwise end up in the first header name
+        reader = csv.DictReader(StringIO(csv_content.removeprefix("\ufeff")))
 
-                if filename in existing_filenames:
-                    skipped += 1
-                    skipped_files.append({"row": index + 1, "filename": filename})
-                    continue
+        missing_columns = [col for col in ("filename", "transcription") if col not in (reader.fieldnames or [])]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}")
 
-                new_audio = Audio(
-                    audio_filename=filename,
-                    google_transcription=transcription,
-                    transcription_count=0,
-                )
-                db.add(new_audio)
-                inserted += 1
+        entries = []
+        records = []
+        seen_filenames = set()
+        for row_number, row in enumerate(reader, start=1):
+            filename = (row["filename"] or "").strip()
+            is_candidate = bool(filename) and filename not in seen_filenames
+            entries.append((row_number, filename, is_candidate))
+            if is_candidate:
+                seen_filenames.add(filename)
+                records.append((filename, (row["transcription"] or "").strip() or None))
 
-            await db.commit()
-            logger.info(f"Bulk insert completed: {inserted} inserted, {skipped} skipped")
-            return inserted, skipped, skipped_files
+        return entries, records
 
-        except Exception as e:
-            await db.rollback()
-            logger.error(f"Error during bulk insert: {e}")
-            raise
+    @staticmethod
+    async def _copy_insert_audio(db: AsyncSession, records: List[Tuple[str, Optional[str]]]) -> set:
+        """
+        Load (filename, transcription) records with COPY and insert the new ones.
+        
+        Records are streamed into a transaction-scoped staging table over the
+        asyncpg COPY protocol, then moved into "Audio" with a single
+        INSERT ... SELECT that skips existing filenames. Must be called inside
+        an open transaction. Returns the filenames that were inserted.
+        """
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+
+        await db.execute(_CREATE_AUDIO_STAGE_SQL)
+        await raw_connection.driver_connection.copy_records_to_table(
+            "audio_stage",
+            records=records,
+            columns=["audio_filename", "google_transcription"],
+        )
+        result = await db.execute(_INSERT_FROM_AUDIO_STAGE_SQL)
+        return set(result.scalars().all())
 
 
 class TranscriptionService:
@@ -285,6 +637,10 @@ class TranscriptionService:
         If audio is marked as unsuitable (is_audio_suitable=False), this method will:
         1. Update the Audio table to mark it as "not_suitable" and clear metadata
         2. Create a Transcriptions entry with nullified fields
+        3. Delete the original audio file from Google Cloud Storage
+        
+        Steps 1 and 2 run as a single CTE statement; the GCS deletion happens
+        after the commit so the transaction never waits on Google.
         
         Args:
             db: Database session
@@ -295,196 +651,300 @@ class TranscriptionService:
         """
         # Check if audio is being marked as unsuitable
         is_unsuitable = transcription_data.is_audio_suitable is False
-        
-        if is_unsuitable:
-            # Update the Audio table for unsuitable audio
-            try:
-                # Fetch the audio record
-                result = await db.execute(
-                    select(Audio).where(Audio.audio_id == transcription_data.audio_id)
+        original_filename = None
+
+        try:
+            if is_unsuitable:
+                new_transcription, original_filename = await TranscriptionService._insert_unsuitable_transcription(
+                    db, transcription_data
                 )
-                audio_record = result.scalar_one_or_none()
-                
-                if audio_record:
-                    # Store the original filename before updating
-                    original_filename = audio_record.audio_filename
-                    
-                    # Delete the audio file from Google Cloud Storage
-                    try:
-                        deletion_success = await gcs_service.delete_blob(original_filename)
-                        if deletion_success:
-                            logger.info(
-                                f"Successfully deleted audio file from GCS: {original_filename}"
-                            )
-                        else:
-                            logger.warning(
-                                f"Audio file not found in GCS (may have been deleted already): {original_filename}"
-                            )
-                    except Exception as gcs_error:
-                        logger.error(
-                            f"Failed to delete audio file from GCS: {original_filename}. Error: {gcs_error}"
-                        )
-                        # Continue with database update even if GCS deletion fails
-                    
-                    # Update Audio table fields for unsuitable audio
-                    audio_record.audio_filename = "not_suitable"
-                    audio_record.google_transcription = "Audio not suitable for transcription"
-                    audio_record.start_time = None
-                    audio_record.end_time = None
-                    audio_record.padded_duration = None
-                    audio_record.created_at = None
-                    
-                    logger.info(
-                        f"Marked audio {transcription_data.audio_id} as not_suitable "
-                        f"and cleared metadata fields"
+            else:
+                # Create normal transcription with all metadata
+                # Note: created_at is not set here, so the database default (NOW()) will be used
+                new_transcription = await db.scalar(
+                    insert(Transcriptions)
+                    .values(
+                        audio_id=transcription_data.audio_id,
+                        transcription=transcription_data.transcription,
+                        speaker_gender=transcription_data.speaker_gender,
+                        has_noise=transcription_data.has_noise,
+                        is_code_mixed=transcription_data.is_code_mixed,
+                        is_speaker_overlappings_exist=transcription_data.is_speaker_overlappings_exist,
+                        is_audio_suitable=transcription_data.is_audio_suitable,
+                        admin=transcription_data.admin,
+                        validated_at=transcription_data.validated_at,
                     )
-            except Exception as e:
-                logger.error(f"Error updating audio record for unsuitable audio: {e}")
-                await db.rollback()
-                raise
-            
-            # Create transcription with nullified fields for unsuitable audio
-            new_transcription = Transcriptions(
-                audio_id=transcription_data.audio_id,
-                transcription=transcription_data.transcription,
-                speaker_gender=None,
-                has_noise=None,
-                is_code_mixed=None,
-                is_speaker_overlappings_exist=None,
-                is_audio_suitable=False,
-                admin=None,
-                validated_at=None,
-                created_at=None
-            )
-        else:
-            # Create normal transcription with all metadata
-            # Note: created_at is not set here, so the database default (NOW()) will be used
-            new_transcription = Transcriptions(
-                audio_id=transcription_data.audio_id,
-                transcription=transcription_data.transcription,
-                speaker_gender=transcription_data.speaker_gender,
-                has_noise=transcription_data.has_noise,
-                is_code_mixed=transcription_data.is_code_mixed,
-                is_speaker_overlappings_exist=transcription_data.is_speaker_overlappings_exist,
-                is_audio_suitable=transcription_data.is_audio_suitable,
-                admin=transcription_data.admin,
-                validated_at=transcription_data.validated_at
-            )
+                    .returning(Transcriptions)
+                )
+
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error("Error creating transcription for audio %s: %s", transcription_data.audio_id, e)
+            raise
 
-        db.add(new_transcription)
-        await db.commit()
-        
         if is_unsuitable:
+            await TranscriptionService._delete_unsuitable_audio_blob(original_filename)
             logger.info(
-                f"Created unsuitable transcription: {new_transcription.trans_id} "
-                f"for audio: {transcription_data.audio_id} "
-                f"(all metadata fields nullified)"
+                "Created unsuitable transcription: %s "
+                "for audio: %s "
+                "(all metadata fields nullified)",
+                new_transcription.trans_id,
+                transcription_data.audio_id
             )
         else:
             logger.info(
-                f"Created new transcription: {new_transcription.trans_id} "
-                f"for audio: {transcription_data.audio_id} "
-                f"(validated_at: {transcription_data.validated_at}, admin: {transcription_data.admin}) "
-                f"(transcription_count updated by trigger)"
+                "Created new transcription: %s "
+                "for audio: %s "
+                "(validated_at: %s, admin: %s) "
+                "(transcription_count updated by trigger)",
+                new_transcription.trans_id,
+                transcription_data.audio_id,
+                transcription_data.validated_at,
+                transcription_data.admin
             )
         return new_transcription
 
     @staticmethod
-    async def get_transcriptions_for_audio(db: AsyncSession, audio_id: UUID) -> List[Transcriptions]:
-        """Get all transcriptions for a specific audio file."""
+    async def _insert_unsuitable_transcription(
+        db: AsyncSession,
+        transcription_data: TranscriptionCreate
+    ) -> Tuple[Transcriptions, Optional[str]]:
+        """
+        Reset the audio record and insert the nullified transcription.
+        
+        Runs as one statement in the caller's transaction without committing.
+        
+        Returns:
+            Tuple of (created transcription, original audio filename or None
+            if the audio record was not found)
+        """
+        result = await db.execute(_CREATE_UNSUITABLE_TRANSCRIPTION_SQL, {
+            "trans_id": uuid4(),
+            "audio_id": transcription_data.audio_id,
+            "transcription": transcription_data.transcription,
+        })
+        row = dict(result.mappings().one())
+        original_filename = row.pop("original_filename")
+        return Transcriptions(**row), original_filename
+
+    @staticmethod
+    async def _delete_unsuitable_audio_blob(original_filename: Optional[str]) -> None:
+        """
+        Delete an unsuitable audio file from Google Cloud Storage.
+        
+        Called after the database commit so transactions never wait on GCS.
+        Failures are logged and not raised; the database state is already final.
+        """
+        if original_filename is None:
+            return
+
         try:
-            result = await db.execute(select(Transcriptions).where(Transcriptions.audio_id == audio_id))
-            return result.scalars().all()
+            deletion_success = await gcs_service.delete_blob(original_filename)
+            if deletion_success:
+                logger.info(
+                    "Successfully deleted audio file from GCS: %s",
+                    original_filename
+                )
+            else:
+                logger.warning(
+                    "Audio file not found in GCS (may have been deleted already): %s",
+                    original_filename
+                )
+        except Exception as gcs_error:
+            logger.error(
+                "Failed to delete audio file from GCS: %s. Error: %s",
+                original_filename,
+                gcs_error
+            )
+
+    @staticmethod
+    async def create_transcription_and_release(
+        db: AsyncSession,
+        transcription_data: TranscriptionCreate
+    ) -> Transcriptions:
+        """
+        Create a transcription and release the audio lease in one statement.
+        
+        The INSERT into "Transcriptions" and the lease release on "Audio" are
+        fused into a single CTE, so a submission costs one round-trip and one
+        transaction, and there is no window where the transcription exists
+        while the audio is still leased.
+        
+        Unsuitable audio requires GCS cleanup and metadata resets, so that
+        path falls back to `create_transcription` followed by
+        `AudioService.release_audio_lease`.
+        
+        Args:
+            db: Database session
+            transcription_data: Validated transcription data
+            
+        Returns:
+            Transcriptions: Created transcription record
+        """
+        if transcription_data.is_audio_suitable is False:
+            new_transcription = await TranscriptionService.create_transcription(db, transcription_data)
+            await AudioService.release_audio_lease(db, transcription_data.audio_id)
+            return new_transcription
+
+        try:
+            result = await db.execute(_CREATE_TRANSCRIPTION_AND_RELEASE_SQL, {
+                "trans_id": uuid4(),
+                "audio_id": transcription_data.audio_id,
+                "transcription": transcription_data.transcription,
+                "speaker_gender": transcription_data.speaker_gender,
+                "has_noise": transcription_data.has_noise,
+                "is_code_mixed": transcription_data.is_code_mixed,
+                "is_speaker_overlappings_exist": transcription_data.is_speaker_overlappings_exist,
+                "is_audio_suitable": transcription_data.is_audio_suitable,
+                "admin": transcription_data.admin,
+                "validated_at": transcription_data.validated_at,
+            })
+            row = result.mappings().one()
+            await db.commit()
+            # The lease was released in SQL; don't wait for an audio_ready notification
+            audio_availability.mark_available()
+
+            new_transcription = Transcriptions(**row)
+            logger.info(
+                "Created new transcription: %s "
+                "for audio: %s and released its lease",
+                new_transcription.trans_id,
+                transcription_data.audio_id
+            )
+            return new_transcription
+
         except Exception as e:
-            logger.error(f"Error getting transcriptions for audio: {e}")
+            await db.rollback()
+            logger.error("Error creating transcription and releasing lease: %s", e)
+            raise
+
+    @staticmethod
+    async def create_transcriptions_bulk(
+        db: AsyncSession,
+        transcriptions_data: List[TranscriptionCreate]
+    ) -> List[Transcriptions]:
+        """
+        Create many transcription records in a single transaction.
+        
+        Suitable transcriptions are written with one multi-row
+        INSERT ... RETURNING. Items marked as unsuitable get their audio reset
+        in the same transaction, so either every item is stored or none is.
+        GCS files of unsuitable audio are deleted only after the commit.
+        
+        Args:
+            db: Database session
+            transcriptions_data: Validated transcription payloads
+            
+        Returns:
+            List[Transcriptions]: Created records in the same order as the input
+        """
+        created: List[Optional[Transcriptions]] = [None] * len(transcriptions_data)
+        unsuitable_filenames = []
+        suitable_indexes = [
+            index for index, item in enumerate(transcriptions_data)
+            if item.is_audio_suitable is not False
+        ]
+
+        try:
+            if suitable_indexes:
+                rows = [
+                    {
+                        "audio_id": transcriptions_data[index].audio_id,
+                        "transcription": transcriptions_data[index].transcription,
+                        "speaker_gender": transcriptions_data[index].speaker_gender,
+                        "has_noise": transcriptions_data[index].has_noise,
+                        "is_code_mixed": transcriptions_data[index].is_code_mixed,
+                        "is_speaker_overlappings_exist": transcriptions_data[index].is_speaker_overlappings_exist,
+                        "is_audio_suitable": transcriptions_data[index].is_audio_suitable,
+                        "admin": transcriptions_data[index].admin,
+                        "validated_at": transcriptions_data[index].validated_at,
+                    }
+                    for index in suitable_indexes
+                ]
+                result = await db.scalars(
+                    insert(Transcriptions).returning(Transcriptions, sort_by_parameter_order=True),
+                    rows,
+                )
+                for index, transcription in zip(suitable_indexes, result.all()):
+                    created[index] = transcription
+
+            for index, item in enumerate(transcriptions_data):
+                if created[index] is None:
+                    created[index], original_filename = await TranscriptionService._insert_unsuitable_transcription(
+                        db, item
+                    )
+                    unsuitable_filenames.append(original_filename)
+
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error("Error during bulk transcription insert: %s", e)
+            raise
+
+        for original_filename in unsuitable_filenames:
+            await TranscriptionService._delete_unsuitable_audio_blob(original_filename)
+
+        logger.info(
+            "Bulk created %s transcriptions "
+            "(%s in a single insert)",
+            len(created),
+            len(suitable_indexes)
+        )
+        return created
+
+    @staticmethod
+    async def get_transcriptions_for_audio(db: AsyncSession, audio_id: UUID) -> AsyncIterator[RowMapping]:
+        """
+        Stream the transcriptions for a specific audio file.
+        
+        Only the columns needed to render a results list are selected, and rows
+        are fetched from a server-side cursor in batches so memory stays bounded
+        regardless of how many transcriptions an audio file has.
+        """
+        try:
+            result = await db.stream(_TRANSCRIPTIONS_FOR_AUDIO_STMT, {"audio_id": audio_id})
+            async for row in result.mappings():
+                yield row
+        except Exception as e:
+            logger.error("Error getting transcriptions for audio: %s", e)
             raise
 
     @staticmethod
     async def get_next_unvalidated_transcription(
         db: AsyncSession
-    ) -> Optional[Tuple[Transcriptions, Audio]]:
+    ) -> Optional[Tuple[TranscriptionRow, AudioRow]]:
         """
         Fetch the next available transcription that needs validation.
         
         Uses a lease-based system similar to audio claiming to prevent multiple
-        users from getting the same transcription. Falls back to different
-        transcriptions if the first one is already being validated.
+        users from getting the same transcription. Selecting the candidate
+        (skipping rows locked by other validators) and leasing its audio happen
+        in a single CTE statement, so a claim is one round-trip.
         """
         try:
-            # Use raw SQL query to properly handle lease expiration with NOW()
-            query = text("""
-                SELECT 
-                    t.trans_id, t.audio_id, t.transcription, t.speaker_gender, 
-                    t.has_noise, t.is_code_mixed, t.is_speaker_overlappings_exist, 
-                    t.is_audio_suitable, t.admin, t.validated_at, t.created_at,
-                    a.audio_id, a.audio_filename, a.google_transcription, 
-                    a.transcription_count, a.leased_until
-                FROM "Transcriptions" t
-                JOIN "Audio" a ON t.audio_id = a.audio_id
-                WHERE t.is_audio_suitable = TRUE
-                    AND t.validated_at IS NULL
-                    AND (a.leased_until IS NULL OR a.leased_until < NOW())
-                ORDER BY t.created_at ASC
-                LIMIT 5
-                FOR UPDATE OF t, a SKIP LOCKED
-            """)
-            
-            result = await db.execute(query)
-            rows = result.fetchall()
-            
-            # Try to lease each transcription until we find one that's available
-            for row in rows:
-                audio_id = row[1]  # t.audio_id from the query
-                
-                # Try to lease this audio for validation
-                leased = await AudioService.lease_audio_for_validation(db, audio_id)
-                if leased:
-                    # Create transcription and audio objects from the row data
-                    transcription_data = {
-                        'trans_id': row[0],
-                        'audio_id': row[1], 
-                        'transcription': row[2],
-                        'speaker_gender': row[3],
-                        'has_noise': row[4],
-                        'is_code_mixed': row[5],
-                        'is_speaker_overlappings_exist': row[6],
-                        'is_audio_suitable': row[7],
-                        'admin': row[8],
-                        'validated_at': row[9],
-                        'created_at': row[10]
-                    }
-                    
-                    audio_data = {
-                        'audio_id': row[11],
-                        'audio_filename': row[12],
-                        'google_transcription': row[13],
-                        'transcription_count': row[14],
-                        'leased_until': row[15]
-                    }
-                    
-                    # Create minimal objects for compatibility
-                    class TranscriptionObj:
-                        def __init__(self, data):
-                            for key, value in data.items():
-                                setattr(self, key, value)
-                    
-                    class AudioObj:
-                        def __init__(self, data):
-                            for key, value in data.items():
-                                setattr(self, key, value)
-                    
-                    transcription_obj = TranscriptionObj(transcription_data)
-                    audio_obj = AudioObj(audio_data)
-                    
-                    logger.info(f"Successfully claimed transcription {transcription_obj.trans_id} for validation")
-                    return transcription_obj, audio_obj
-            
-            # If we couldn't lease any of the transcriptions, return None
-            logger.info("No transcriptions available for validation at this time")
-            return None
-            
+            result = await db.execute(_CLAIM_NEXT_UNVALIDATED_SQL, {
+                "lease_duration": _LEASE_DURATION,
+            })
+            row = result.one_or_none()
+
+            if not row:
+                await db.rollback()
+                logger.info("No transcriptions available for validation at this time")
+                return None
+
+            await db.commit()
+
+            # RETURNING columns follow the TranscriptionRow then AudioRow field order
+            transcription_obj = TranscriptionRow(*row[:11])
+            audio_obj = AudioRow(*row[11:])
+
+            logger.info("Successfully claimed transcription %s for validation", transcription_obj.trans_id)
+            return transcription_obj, audio_obj
+
         except Exception as e:
-            logger.error(f"Error fetching next unvalidated transcription: {e}")
+            await db.rollback()
+            logger.error("Error fetching next unvalidated transcription: %s", e)
             raise
 
     @staticmethod
@@ -493,22 +953,10 @@ class TranscriptionService:
     ) -> dict:
         """Return counts of pending and completed validations."""
         try:
-            total_stmt = (
-                select(func.count())
-                .select_from(Transcriptions)
-                .where(Transcriptions.is_audio_suitable.is_(True))
-            )
-            pending_stmt = (
-                select(func.count())
-                .select_from(Transcriptions)
-                .where(Transcriptions.validated_at.is_(None) & Transcriptions.is_audio_suitable.is_(True))
-            )
+            counts = (await db.execute(_VALIDATION_PROGRESS_COUNTS_STMT)).one()
 
-            total_result = await db.execute(total_stmt)
-            pending_result = await db.execute(pending_stmt)
-
-            total = int(total_result.scalar_one())
-            pending = int(pending_result.scalar_one())
+            total = int(counts.total)
+            pending = int(counts.pending)
             completed = max(total - pending, 0)
 
             return {"total": total, "pending": pending, "completed": completed}
@@ -521,124 +969,99 @@ class TranscriptionService:
         db: AsyncSession,
         trans_id: UUID,
         update_data: TranscriptionValidationUpdate
-    ) -> Transcriptions:
+    ) -> TranscriptionRow:
         """
         Update transcription fields and mark the record as validated.
         
+        The transcription update and the audio lease release run as a single
+        UPDATE ... RETURNING statement; an empty result means the transcription
+        does not exist.
+        
         If audio is marked as unsuitable (is_audio_suitable=False), this method will:
         1. Update the Audio table to mark it as "not_suitable" and clear metadata
-        2. Delete the audio file from Google Cloud Storage
-        3. Update the Transcriptions entry with nullified fields
+        2. Update the Transcriptions entry with nullified fields
+        3. Delete the audio file from Google Cloud Storage (after the commit)
         """
-        try:
-            result = await db.execute(
-                select(Transcriptions).where(Transcriptions.trans_id == trans_id)
-            )
-            transcription = result.scalar_one_or_none()
-            if not transcription:
-                raise ValueError(f"Transcription not found: {trans_id}")
+        # Check if audio is being marked as unsuitable
+        is_unsuitable = update_data.is_audio_suitable is False
 
-            # Check if audio is being marked as unsuitable
-            is_unsuitable = update_data.is_audio_suitable is False
-            
+        try:
             if is_unsuitable:
-                # Fetch the audio record
-                audio_result = await db.execute(
-                    select(Audio).where(Audio.audio_id == transcription.audio_id)
-                )
-                audio_record = audio_result.scalar_one_or_none()
-                
-                if audio_record:
-                    # Store the original filename before updating
-                    original_filename = audio_record.audio_filename
-                    
-                    # Delete the audio file from Google Cloud Storage
-                    try:
-                        deletion_success = await gcs_service.delete_blob(original_filename)
-                        if deletion_success:
-                            logger.info(
-                                f"Successfully deleted audio file from GCS during validation: {original_filename}"
-                            )
-                        else:
-                            logger.warning(
-                                f"Audio file not found in GCS during validation (may have been deleted already): {original_filename}"
-                            )
-                    except Exception as gcs_error:
-                        logger.error(
-                            f"Failed to delete audio file from GCS during validation: {original_filename}. Error: {gcs_error}"
-                        )
-                        # Continue with database update even if GCS deletion fails
-                    
-                    # Update Audio table fields for unsuitable audio
-                    audio_record.audio_filename = "not_suitable"
-                    audio_record.google_transcription = "Audio not suitable for transcription"
-                    audio_record.start_time = None
-                    audio_record.end_time = None
-                    audio_record.padded_duration = None
-                    audio_record.created_at = None
-                    
-                    logger.info(
-                        f"Marked audio {transcription.audio_id} as not_suitable during validation "
-                        f"and cleared metadata fields"
-                    )
-                
-                # Update transcription with nullified fields for unsuitable audio
-                transcription.transcription = update_data.transcription or "Audio not suitable for transcription"
-                transcription.speaker_gender = None
-                transcription.has_noise = None
-                transcription.is_code_mixed = None
-                transcription.is_speaker_overlappings_exist = None
-                transcription.is_audio_suitable = False
-                transcription.validated_at = None
-                transcription.created_at = None
-                
-                logger.info(
-                    f"Marked transcription {trans_id} as unsuitable during validation "
-                    f"(all metadata fields nullified)"
-                )
+                result = await db.execute(_VALIDATE_UNSUITABLE_TRANSCRIPTION_SQL, {
+                    "trans_id": trans_id,
+                    "transcription": update_data.transcription or "Audio not suitable for transcription",
+                })
             else:
-                # Normal validation - update all fields
-                transcription_text = (update_data.transcription or '').strip()
-                transcription.transcription = transcription_text
-                transcription.speaker_gender = update_data.speaker_gender
-                transcription.has_noise = update_data.has_noise
-                transcription.is_code_mixed = update_data.is_code_mixed
-                transcription.is_speaker_overlappings_exist = update_data.is_speaker_overlappings_exist
-                transcription.is_audio_suitable = (
-                    update_data.is_audio_suitable
-                    if update_data.is_audio_suitable is not None
-                    else transcription.is_audio_suitable
-                )
-                # Keep the original admin value unchanged during validation
-                transcription.validated_at = datetime.now(timezone.utc)
-                
-                logger.info(
-                    f"Validated transcription {trans_id} (audio {transcription.audio_id}) - "
-                    f"original admin: {transcription.admin or 'none'}"
-                )
+                result = await db.execute(_VALIDATE_TRANSCRIPTION_SQL, {
+                    "trans_id": trans_id,
+                    "transcription": (update_data.transcription or '').strip(),
+                    "speaker_gender": update_data.speaker_gender,
+                    "has_noise": update_data.has_noise,
+                    "is_code_mixed": update_data.is_code_mixed,
+                    "is_speaker_overlappings_exist": update_data.is_speaker_overlappings_exist,
+                    "is_audio_suitable": update_data.is_audio_suitable,
+                })
 
-            await db.commit()
-            await db.refresh(transcription)
-
-            try:
-                released = await AudioService.release_audio_lease(db, transcription.audio_id)
-                if not released:
-                    logger.warning(
-                        "Lease release skipped for audio %s after validation",
-                        transcription.audio_id
-                    )
-            except Exception as lease_error:
-                logger.warning(
-                    "Failed to release lease for audio %s after validation: %s",
-                    transcription.audio_id,
-                    lease_error
-                )
+            row = result.one_or_none()
+            if not row:
+                raise ValueError(f"Transcription not found: {trans_id}")
 
-            return transcription
+            await db.commit()
+            # The lease was released in SQL; don't wait for an audio_ready notification
+            audio_availability.mark_available()
         except ValueError:
             await db.rollback()
             raise
         except Exception as e:
             await db.rollback()
-            logger.error(f"Error validating transcription {trans_id}: {e}")
+            logger.error("Error validating transcription %s: %s", trans_id, e)
             raise
+
+        # RETURNING columns follow the TranscriptionRow field order
+        transcription = TranscriptionRow(*row[:11])
+
+        if is_unsuitable:
+            original_filename = row[11]
+            if original_filename is not None:
+                # Delete the audio file from Google Cloud Storage outside the DB transaction
+                try:
+                    deletion_success = await gcs_service.delete_blob(original_filename)
+                    if deletion_success:
+                        logger.info(
+                            "Successfully deleted audio file from GCS during validation: %s",
+                            original_filename
+                        )
+                    else:
+                        logger.warning(
+                            "Audio file not found in GCS during validation (may have been deleted already): %s",
+                            original_filename
+                        )
+                except Exception as gcs_error:
+                    logger.error(
+                        "Failed to delete audio file from GCS during validation: %s. Error: %s",
+                        original_filename,
+                        gcs_error
+                    )
+
+                logger.info(
+                    "Marked audio %s as not_suitable during validation "
+                    "and cleared metadata fields",
+                    transcription.audio_id
+                )
+
+            logger.info(
+                "Marked transcription %s as unsuitable during validation "
+                "(all metadata fields nullified)",
+                trans_id
+            )
+        else:
+            # The original admin value is left unchanged during validation
+            logger.info(
+                "Validated transcription %s (audio %s) - "
+                "original admin: %s",
+                trans_id,
+                transcription.audio_id,
+                transcription.admin or 'none'
+            )
+
+        return transcription
@@ -6,17 +6,62 @@ Storage, including file listing, metadata retrieval, and signed URL generation
 for secure audio file access.
 """
 
+import asyncio
 import logging
-from typing import Optional, List
+import sys
+import time
+from dataclasses import dataclass
+from typing import Optional, List, Tuple, AsyncIterator
 from google.cloud import storage
 from google.cloud.exceptions import NotFound, GoogleCloudError
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from app.core.config import settings
 from app.core.gcp_auth import gcp_auth_manager
 
 logger = logging.getLogger(__name__)
 
+# Only the metadata fields used by the listing, returned directly by the LIST call
+_LIST_BLOB_FIELDS = "items(name,size,contentType,timeCreated,updated,md5Hash),nextPageToken"
+
+# Maximum concurrent per-folder LIST calls when listing a whole prefix
+_LIST_SHARD_CONCURRENCY = 16
+
+# Maximum number of operations GCS accepts in a single batch request
+_BATCH_SIZE = 100
+
+# Maximum batch requests in flight at once for bulk deletes and metadata lookups
+_BATCH_CONCURRENCY = 8
+
+# Signed URLs are reused until less than this much validity remains
+_SIGNED_URL_MIN_REMAINING_SECONDS = 600
+_SIGNED_URL_CACHE_SIZE = 1024
+
+# Placeholder for metadata fields GCS did not return
+_UNKNOWN = 'unknown'
+
+
+@dataclass(slots=True)
+class FileMetadataRow:
+    """Listing metadata for one blob; slotted to keep large listings compact."""
+    filename: str
+    full_path: str
+    size_bytes: int
+    size_mb: float
+    content_type: str
+    created_date: str
+    updated_date: str
+    md5_hash: str
+    is_audio_file: bool
+
+
+def _format_timestamp(value: Optional[datetime]) -> str:
+    """Format a GCS timestamp as 'YYYY-MM-DD HH:MM:SS' (UTC), or 'unknown'."""
+    if value is None:
+        return _UNKNOWN
+    # isoformat is implemented in C and much cheaper than strftime per blob
+    return value.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
+
 
 class GCSService:
     """
@@ -31,6 +76,18 @@ class GCSService:
         """Initialize with lazy-loaded client and bucket."""
         self._client = None
         self._bucket = None
+        # (blob_name, expiration_hours) -> (signed_url, reuse_until monotonic time)
+        self._signed_url_cache = {}
+        # Signing tasks in flight, shared by concurrent requests for the same key
+        self._signed_url_pending = {}
+        # Lowercase suffixes for str.endswith, resolved once from settings
+        self._audio_suffixes = tuple(fmt.lower() for fmt in settings.SUPPORTED_AUDIO_FORMATS)
+        # prefix -> (listed_at monotonic time, (all files, audio files))
+        self._list_cache = {}
+        # Listing tasks in flight, one per prefix, shared by every caller that needs it
+        self._list_refreshes = {}
+        # Bumped by deletions so a listing that started earlier is not cached
+        self._list_generation = 0
     
     @property
     def client(self):
@@ -62,6 +119,11 @@ class GCSService:
         """
         Generate a signed URL for accessing a blob.
         
+        URLs are cached per (blob_name, expiration_hours) and reused while at
+        least 10 minutes of validity remain, so repeat requests for the same
+        audio skip signing. Concurrent misses for one key share a single
+        signing call.
+        
         Args:
             blob_name: Name/path of the blob in GCS
             expiration_hours: Hours until URL expires
@@ -69,14 +131,30 @@ class GCSService:
         Returns:
             Signed URL string
         """
+        key = (blob_name, expiration_hours)
+        cached = self._signed_url_cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
         try:
-            blob = self.bucket.blob(blob_name)
-            
-            # Generate signed URL
-            signed_url = blob.generate_signed_url(
-                expiration=timedelta(hours=expiration_hours),
-                method='GET'
-            )
+            pending = self._signed_url_pending.get(key)
+            if pending is None:
+                blob = self.bucket.blob(blob_name)
+                
+                # Generate signed URL off the event loop (signing may call IAM)
+                pending = asyncio.ensure_future(asyncio.to_thread(
+                    blob.generate_signed_url,
+                    expiration=timedelta(hours=expiration_hours),
+                    method='GET'
+                ))
+                self._signed_url_pending[key] = pending
+                pending.add_done_callback(lambda _: self._signed_url_pending.pop(key, None))
+                signed_at = time.monotonic()
+                
+                signed_url = await asyncio.shield(pending)
+                self._cache_signed_url(key, signed_url, signed_at)
+            else:
+                signed_url = await asyncio.shield(pending)
             
             return signed_url
             
@@ -87,6 +165,20 @@ class GCSService:
             logger.error(f"Unexpected error when generating signed URL: {e}")
             raise
     
+    def has_cached_signed_url(self, blob_name: str, expiration_hours: int = 1) -> bool:
+        """Return True if generate_signed_url would be served from the cache."""
+        cached = self._signed_url_cache.get((blob_name, expiration_hours))
+        return cached is not None and cached[1] > time.monotonic()
+    
+    def _cache_signed_url(self, key: tuple, signed_url: str, signed_at: float) -> None:
+        """Store a signed URL, evicting the oldest entry when the cache is full."""
+        reuse_seconds = key[1] * 3600 - _SIGNED_URL_MIN_REMAINING_SECONDS
+        if reuse_seconds <= 0:
+            return
+        if len(self._signed_url_cache) >= _SIGNED_URL_CACHE_SIZE and key not in self._signed_url_cache:
+            del self._signed_url_cache[next(iter(self._signed_url_cache))]
+        self._signed_url_cache[key] = (signed_url, signed_at + reuse_seconds)
+    
     async def delete_blob(self, blob_name: str) -> bool:
         """
         Delete a blob from the GCS bucket.
@@ -102,7 +194,8 @@ class GCSService:
         """
         try:
             blob = self.bucket.blob(blob_name)
-            blob.delete()
+            await asyncio.to_thread(blob.delete)
+            self._invalidate_listings()
             logger.info(f"Successfully deleted blob from GCS: {blob_name}")
             return True
             
@@ -136,26 +229,27 @@ class GCSService:
             'failed': [],
         }
         
-        for blob_name in blob_names:
-            try:
-                blob = self.bucket.blob(blob_name)
-                blob.delete()
-                results['successful'].append(blob_name)
-                logger.info(f"Successfully deleted blob from GCS: {blob_name}")
-                
-            except NotFound:
-                results['not_found'].append(blob_name)
-                logger.warning(f"Blob not found for deletion: {blob_name}")
-                
-            except GoogleCloudError as e:
-                error_msg = str(e)
-                results['failed'].append((blob_name, error_msg))
-                logger.error(f"GCS error when deleting blob '{blob_name}': {e}")
-                
-            except Exception as e:
-                error_msg = str(e)
-                results['failed'].append((blob_name, error_msg))
-                logger.error(f"Unexpected error when deleting blob '{blob_name}': {e}")
+        for chunk, outcome in await self._run_batches(self._delete_blob_batch, blob_names):
+            if isinstance(outcome, Exception):
+                for blob_name in chunk:
+                    results['failed'].append((blob_name, str(outcome)))
+                logger.error(f"GCS batch deletion of {len(chunk)} blobs failed: {outcome}")
+                continue
+            
+            for blob_name, status_code, response_text in outcome:
+                if 200 <= status_code < 300:
+                    results['successful'].append(blob_name)
+                    logger.info(f"Successfully deleted blob from GCS: {blob_name}")
+                elif status_code == 404:
+                    results['not_found'].append(blob_name)
+                    logger.warning(f"Blob not found for deletion: {blob_name}")
+                else:
+                    error_msg = f"{status_code} {response_text}"
+                    results['failed'].append((blob_name, error_msg))
+                    logger.error(f"GCS error when deleting blob '{blob_name}': {error_msg}")
+        
+        if results['successful']:
+            self._invalidate_listings()
         
         # Add summary
         results['summary'] = {
@@ -173,6 +267,39 @@ class GCSService:
         
         return results
     
+    def _delete_blob_batch(self, bucket, blob_names: List[str]) -> List[tuple]:
+        """
+        Delete up to _BATCH_SIZE blobs with a single GCS batch request.
+        
+        Blocking; run it in a worker thread. Per-blob failures do not raise.
+        
+        Returns:
+            List of (blob_name, status_code, response_text) tuples, one per blob
+        """
+        def queue():
+            for blob_name in blob_names:
+                bucket.blob(blob_name).delete()
+        
+        return [
+            (blob_name, response.status_code, response.text)
+            for blob_name, response in zip(blob_names, self._send_batch(queue))
+        ]
+    
+    def _send_batch(self, queue) -> list:
+        """
+        Send the requests made by queue() as one GCS batch and return the
+        HTTP sub-responses in request order.
+        
+        Per-request failures do not raise; callers inspect each status_code.
+        """
+        # Relies on client.batch(raise_exception=False) and the private
+        # Batch._responses list, both present since google-cloud-storage 2.10.0
+        # (the minimum pinned in requirements.txt)
+        batch = self.client.batch(raise_exception=False)
+        with batch:
+            queue()
+        return list(batch._responses)
+    
     async def get_blob_metadata(self, blob_name: str) -> Optional[dict]:
         """
         Get metadata for a specific blob.
@@ -185,16 +312,9 @@ class GCSService:
         """
         try:
             blob = self.bucket.blob(blob_name)
-            blob.reload()
+            await asyncio.to_thread(blob.reload)
             
-            return {
-                'name': blob.name,
-                'size': blob.size,
-                'content_type': blob.content_type,
-                'created': blob.time_created,
-                'updated': blob.updated,
-                'md5_hash': blob.md5_hash
-            }
+            return self._blob_metadata(blob)
             
         except NotFound:
             logger.warning(f"Blob not found: {blob_name}")
@@ -206,85 +326,379 @@ class GCSService:
             logger.error(f"Unexpected error when getting blob metadata: {e}")
             raise
     
-    async def list_all_files(self) -> List[dict]:
+    @staticmethod
+    def _blob_metadata(blob) -> dict:
+        """Build the metadata dictionary for a loaded blob."""
+        return {
+            'name': blob.name,
+            'size': blob.size,
+            'content_type': blob.content_type,
+            'created': blob.time_created,
+            'updated': blob.updated,
+            'md5_hash': blob.md5_hash
+        }
+    
+    async def get_many_blob_metadata(self, blob_names: List[str]) -> List[Optional[dict]]:
+        """
+        Get metadata for many blobs using GCS batch requests.
+        
+        Lookups are sent _BATCH_SIZE at a time in a single HTTP request each,
+        so N lookups take ceil(N / _BATCH_SIZE) requests instead of N.
+        
+        Args:
+            blob_names: Names/paths of the blobs in GCS
+            
+        Returns:
+            Metadata dictionaries (or None if not found) in the same order as blob_names
+        """
+        results = []
+        for chunk, outcome in await self._run_batches(self._reload_blob_batch, blob_names):
+            if isinstance(outcome, Exception):
+                logger.error(f"GCS batch metadata lookup of {len(chunk)} blobs failed: {outcome}")
+                raise outcome
+            results.extend(outcome)
+        return results
+    
+    def _reload_blob_batch(self, bucket, blob_names: List[str]) -> List[Optional[dict]]:
+        """
+        Fetch metadata for up to _BATCH_SIZE blobs with a single GCS batch request.
+        
+        Blocking; run it in a worker thread.
+        
+        Returns:
+            Metadata dictionaries (or None if not found), one per blob
+        """
+        blobs = [bucket.blob(blob_name) for blob_name in blob_names]
+        def queue():
+            for blob in blobs:
+                blob.reload()
+        
+        results = []
+        for blob, response in zip(blobs, self._send_batch(queue)):
+            if 200 <= response.status_code < 300:
+                results.append(self._blob_metadata(blob))
+            elif response.status_code == 404:
+                logger.warning(f"Blob not found: {blob.name}")
+                results.append(None)
+            else:
+                raise GoogleCloudError(
+                    f"{response.status_code} {response.text} (blob '{blob.name}')"
+                )
+        return results
+    
+    async def _run_batches(self, batch_fn, blob_names: List[str]) -> List[tuple]:
+        """
+        Run a blocking batch_fn(bucket, chunk) over blob_names in _BATCH_SIZE chunks.
+        
+        At most _BATCH_CONCURRENCY batches run at once, each in a worker thread.
+        
+        Returns:
+            List of (chunk, outcome) tuples in order, where outcome is the
+            function's return value or the exception it raised
+        """
+        # Resolve the lazy bucket (and client) once, before handing work to threads
+        bucket = self.bucket
+        semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        chunks = [
+            blob_names[i:i + _BATCH_SIZE]
+            for i in range(0, len(blob_names), _BATCH_SIZE)
+        ]
+        
+        async def run(chunk: List[str]):
+            async with semaphore:
+                return await asyncio.to_thread(batch_fn, bucket, chunk)
+        
+        outcomes = await asyncio.gather(
+            *(run(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+        return list(zip(chunks, outcomes))
+    
+    async def list_all_files(self, prefix: Optional[str] = None) -> List[FileMetadataRow]:
         """
         List all files in the GCS bucket with their metadata.
         
+        Args:
+            prefix: Only list blobs whose path starts with this prefix
+        
         Returns:
-            List of dictionaries containing file metadata
+            List of file metadata rows
         """
-        return await self._list_files(audio_only=False)
+        all_files, _ = await self.list_files_and_audio(prefix)
+        return all_files
 
-    async def list_all_audio_files(self) -> List[dict]:
+    async def list_all_audio_files(self, prefix: Optional[str] = None) -> List[FileMetadataRow]:
         """
         List only audio files in the GCS bucket with their metadata.
         
+        Args:
+            prefix: Only list blobs whose path starts with this prefix
+        
         Returns:
-            List of dictionaries containing audio file metadata
+            List of audio file metadata rows
         """
-        return await self._list_files(audio_only=True)
+        _, audio_files = await self.list_files_and_audio(prefix)
+        return audio_files
 
-    async def _list_files(self, audio_only: bool = False) -> List[dict]:
+    async def list_files_and_audio(self, prefix: Optional[str] = None) -> Tuple[List[FileMetadataRow], List[FileMetadataRow]]:
         """
-        Private method to list files in the GCS bucket with their metadata.
+        List the bucket once and return both the full and the audio-only view.
+        
+        Both views share the same metadata rows (each carrying
+        is_audio_file) and one cache entry, so serving the two listings costs
+        a single bucket enumeration.
+        
+        Args:
+            prefix: Only list blobs whose path starts with this prefix
+        
+        Returns:
+            Tuple of (all files, audio files), each sorted by filename
+        """
+        return await self._list_files(prefix)
+
+    async def list_files_page(
+        self,
+        page_token: Optional[str] = None,
+        max_results: int = 1000,
+        audio_only: bool = False,
+        prefix: Optional[str] = None,
+    ) -> dict:
+        """
+        List a single page of files in the GCS bucket with their metadata.
+        
+        Files are returned in bucket (full path) order. Pass the returned
+        next_page_token back in to fetch the following page.
         
         Args:
+            page_token: Token from a previous page, or None for the first page
+            max_results: Maximum number of blobs to list in this page
             audio_only: If True, only return audio files. If False, return all files.
+            prefix: Only list blobs whose path starts with this prefix
+        
+        Returns:
+            Dictionary with 'items' (file metadata rows) and 'next_page_token'
+            (None on the last page)
+        """
+        try:
+            items, next_page_token = await self._fetch_files_page(audio_only, page_token, max_results, prefix)
+            return {'items': items, 'next_page_token': next_page_token}
+        except GoogleCloudError as e:
+            logger.error(f"GCS error when listing files page: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error when listing files page: {e}")
+            raise
+
+    async def _list_files(self, prefix: Optional[str] = None) -> Tuple[List[FileMetadataRow], List[FileMetadataRow]]:
+        """
+        List files through an in-process cache with stale-while-revalidate.
+        
+        A listing younger than GCS_LIST_CACHE_TTL_SECONDS is returned as is.
+        An older one is still returned immediately while a background task
+        re-lists the bucket for the next caller, unless it is older than
+        twice the TTL (e.g. after an idle period), in which case the caller
+        waits for a fresh listing. Concurrent callers for the same prefix
+        share one listing task. Deletions through this service clear the
+        cache, and a listing that was in flight during a deletion is not
+        cached.
+        
+        Args:
+            prefix: Only list blobs whose path starts with this prefix
+        
+        Returns:
+            Tuple of (all files, audio files) metadata lists
+        """
+        ttl = settings.GCS_LIST_CACHE_TTL_SECONDS
+        if ttl <= 0:
+            return await self._list_files_uncached(prefix)
+        
+        cached = self._list_cache.get(prefix)
+        if cached is not None:
+            listed_at, listing = cached
+            age = time.monotonic() - listed_at
+            if age < 2 * ttl:
+                if age >= ttl:
+                    self._start_listing_refresh(prefix)
+                return listing
+        
+        # Cold miss or too stale to serve: wait for a fresh listing, joining any in flight
+        return await asyncio.shield(self._start_listing_refresh(prefix))
+
+    def _start_listing_refresh(self, prefix: Optional[str]) -> asyncio.Task:
+        """Return the listing task for a prefix, starting one if none is in flight."""
+        refresh = self._list_refreshes.get(prefix)
+        if refresh is None:
+            refresh = asyncio.create_task(self._refresh_listing(prefix))
+            self._list_refreshes[prefix] = refresh
+            refresh.add_done_callback(lambda task: self._on_listing_refreshed(prefix, task))
+        return refresh
+
+    async def _refresh_listing(self, prefix: Optional[str]) -> Tuple[List[FileMetadataRow], List[FileMetadataRow]]:
+        """List the bucket for a prefix and store the result in the cache."""
+        generation = self._list_generation
+        listed_at = time.monotonic()
+        listing = await self._list_files_uncached(prefix)
+        if generation == self._list_generation:
+            self._list_cache[prefix] = (listed_at, listing)
+        return listing
+
+    def _on_listing_refreshed(self, prefix: Optional[str], task: asyncio.Task) -> None:
+        """Forget a finished listing task; its errors are already logged."""
+        if self._list_refreshes.get(prefix) is task:
+            del self._list_refreshes[prefix]
+        if not task.cancelled():
+            task.exception()
+
+    def _invalidate_listings(self) -> None:
+        """Drop cached listings and detach listings in flight after a deletion."""
+        self._list_generation += 1
+        self._list_cache.clear()
+        self._list_refreshes.clear()
+
+    async def _list_files_uncached(self, prefix: Optional[str] = None) -> Tuple[List[FileMetadataRow], List[FileMetadataRow]]:
+        """
+        Private method to list files in the GCS bucket with their metadata.
+        
+        Args:
+            prefix: Only list blobs whose path starts with this prefix
         
         Returns:
-            List of dictionaries containing file metadata
+            Tuple of (all files, audio files) metadata lists
         """
         try:
-            # List all blobs in the bucket
-            blobs = list(self.bucket.list_blobs())
+            # List each top-level folder concurrently; a flat bucket needs only the first call
+            top_level_blobs, shard_prefixes = await asyncio.to_thread(self._list_top_level, prefix)
+            files_metadata = [self._blob_to_metadata(blob, audio_only=False) for blob in top_level_blobs]
+            semaphore = asyncio.Semaphore(_LIST_SHARD_CONCURRENCY)
             
-            # Filter for audio files if requested
-            if audio_only:
-                blobs = [
-                    blob for blob in blobs 
-                    if any(blob.name.lower().endswith(fmt) for fmt in settings.SUPPORTED_AUDIO_FORMATS)
-                ]
+            async def list_shard(shard_prefix: str) -> List[FileMetadataRow]:
+                async with semaphore:
+                    return [
+                        self._blob_to_metadata(blob, audio_only=False)
+                        async for blob in self._iter_blobs(shard_prefix)
+                    ]
             
-            files_metadata = []
-            for blob in blobs:
-                # Reload to get updated metadata
-                blob.reload()
-                
-                file_metadata = {
-                    'filename': blob.name.split('/')[-1],  # Just the filename without path
-                    'full_path': blob.name,  # Full GCS path
-                    'size_bytes': blob.size or 0,
-                    'size_mb': round((blob.size or 0) / (1024 * 1024), 2),
-                    'content_type': blob.content_type or 'unknown',
-                    'created_date': blob.time_created.strftime('%Y-%m-%d %H:%M:%S') if blob.time_created else 'unknown',
-                    'updated_date': blob.updated.strftime('%Y-%m-%d %H:%M:%S') if blob.updated else 'unknown',
-                    'md5_hash': blob.md5_hash or 'unknown',
-                }
-                
-                # Add is_audio_file flag only when listing all files (not audio-only)
-                if not audio_only:
-                    file_metadata['is_audio_file'] = any(
-                        blob.name.lower().endswith(fmt) for fmt in settings.SUPPORTED_AUDIO_FORMATS
-                    )
-                
-                files_metadata.append(file_metadata)
+            for shard in await asyncio.gather(*(list_shard(p) for p in shard_prefixes)):
+                files_metadata.extend(shard)
             
             # Sort by filename for consistent ordering
-            files_metadata.sort(key=lambda x: x['filename'].lower())
+            files_metadata.sort(key=lambda x: x.filename.lower())
+            audio_files = [file for file in files_metadata if file.is_audio_file]
             
-            file_type = "audio files" if audio_only else "files"
-            logger.info(f"Retrieved metadata for {len(files_metadata)} {file_type} from GCS bucket")
-            return files_metadata
+            logger.info(
+                f"Retrieved metadata for {len(files_metadata)} files "
+                f"({len(audio_files)} audio) from GCS bucket"
+            )
+            return files_metadata, audio_files
             
         except GoogleCloudError as e:
-            error_type = "audio files" if audio_only else "files"
-            logger.error(f"GCS error when listing {error_type}: {e}")
+            logger.error(f"GCS error when listing files: {e}")
             raise
         except Exception as e:
-            error_type = "audio files" if audio_only else "files"
-            logger.error(f"Unexpected error when listing {error_type}: {e}")
+            logger.error(f"Unexpected error when listing files: {e}")
             raise
 
+    async def _fetch_files_page(
+        self,
+        audio_only: bool,
+        page_token: Optional[str],
+        page_size: int,
+        prefix: Optional[str] = None,
+    ) -> Tuple[List[FileMetadataRow], Optional[str]]:
+        """
+        Fetch one LIST page and convert its blobs to metadata rows.
+        
+        The LIST response already carries the metadata we need, so no
+        per-blob reload is required; only the HTTP call runs in a thread.
+        
+        Returns:
+            Tuple of (file metadata list, next page token or None)
+        """
+        iterator = self.bucket.list_blobs(
+            prefix=prefix,
+            fields=_LIST_BLOB_FIELDS,
+            page_size=page_size,
+            page_token=page_token,
+        )
+        page = await asyncio.to_thread(next, iterator.pages, None)
+        if page is None:
+            return [], None
+        
+        files_metadata = []
+        for blob in page:
+            file_metadata = self._blob_to_metadata(blob, audio_only)
+            if file_metadata is not None:
+                files_metadata.append(file_metadata)
+        
+        return files_metadata, iterator.next_page_token
+
+    def _list_top_level(self, prefix: Optional[str] = None) -> Tuple[List[storage.Blob], List[str]]:
+        """
+        List the blobs directly under prefix and the folder prefixes below it.
+        
+        Blocking; run it in a worker thread.
+        
+        Returns:
+            Tuple of (blobs not inside any folder, sorted folder prefixes)
+        """
+        iterator = self.bucket.list_blobs(
+            prefix=prefix,
+            delimiter='/',
+            fields=_LIST_BLOB_FIELDS + ",prefixes",
+            page_size=1000,
+        )
+        blobs = list(iterator)
+        # Folder prefixes are collected as the pages are consumed
+        return blobs, sorted(iterator.prefixes)
+
+    async def _iter_blobs(self, prefix: Optional[str] = None) -> AsyncIterator[storage.Blob]:
+        """
+        Yield blobs from the bucket one LIST page at a time.
+        
+        Only the page fetch runs in a worker thread; at most one page of
+        blobs is held in memory at a time.
+        """
+        pages = self.bucket.list_blobs(
+            prefix=prefix,
+            fields=_LIST_BLOB_FIELDS,
+            page_size=1000,
+        ).pages
+        while True:
+            page = await asyncio.to_thread(next, pages, None)
+            if page is None:
+                break
+            for blob in page:
+                yield blob
+
+    def _blob_to_metadata(self, blob: storage.Blob, audio_only: bool) -> Optional[FileMetadataRow]:
+        """
+        Build the metadata row for a listed blob.
+        
+        Returns None when audio_only is set and the blob is not an audio file.
+        """
+        name = blob.name
+        # str.endswith accepts a tuple, so one C-level call checks every format
+        is_audio_file = name.lower().endswith(self._audio_suffixes)
+        
+        # Filter for audio files if requested
+        if audio_only and not is_audio_file:
+            return None
+        
+        size_bytes = blob.size or 0
+        content_type = blob.content_type
+        return FileMetadataRow(
+            filename=name.rpartition('/')[2],  # Just the filename without path
+            full_path=name,  # Full GCS path
+            size_bytes=size_bytes,
+            size_mb=round(size_bytes / (1024 * 1024), 2),
+            # Few distinct content types exist; interning shares one string across rows
+            content_type=sys.intern(content_type) if content_type else _UNKNOWN,
+            created_date=_format_timestamp(blob.time_created),
+            updated_date=_format_timestamp(blob.updated),
+            md5_hash=blob.md5_hash or _UNKNOWN,
+            is_audio_file=is_audio_file,
+        )
+
 
 
 